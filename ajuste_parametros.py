@@ -0,0 +1,193 @@
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+import numpy as np
+from algoritmo_genetico import algoritmo_genetico, selecao_torneio, selecao_roleta, selecao_ranking
+
+SELECOES = {
+    'torneio': selecao_torneio,
+    'roleta': selecao_roleta,
+    'ranking': selecao_ranking,
+}
+
+ESPACO_PARAMETROS = {
+    'tamanho_populacao': [20, 50, 100, 200],
+    'num_geracoes': [200, 500, 1000, 2000],
+    'taxa_crossover': (0.5, 1.0),   # Intervalo uniforme
+    'taxa_mutacao': (0.001, 0.05),  # Intervalo log-uniforme
+    'funcao_selecao': list(SELECOES),
+    'limite_sem_melhora': [50, 100, 200],
+}
+
+def gerar_configuracoes(num_configuracoes, espaco=ESPACO_PARAMETROS, semente=None):
+    """
+    Sorteia configurações de parâmetros do AG dentro do espaço de busca.
+
+    As opções discretas são sorteadas uniformemente, a taxa de crossover é uniforme no
+    intervalo e a taxa de mutação é log-uniforme, já que seu efeito varia em ordens de grandeza.
+    A função de seleção é representada pelo nome ('torneio', 'roleta' ou 'ranking').
+
+    Args:
+        num_configuracoes: Número de configurações a serem sorteadas.
+        espaco: Dicionário com as opções de cada parâmetro (ver ESPACO_PARAMETROS).
+        semente: Semente aleatória do sorteio.
+
+    Returns:
+        Uma lista de dicionários de parâmetros.
+    """
+    gerador = random.Random(semente)
+    menor_mutacao, maior_mutacao = espaco['taxa_mutacao']
+    configuracoes = []
+    for _ in range(num_configuracoes):
+        configuracoes.append({
+            'tamanho_populacao': gerador.choice(espaco['tamanho_populacao']),
+            'num_geracoes': gerador.choice(espaco['num_geracoes']),
+            'taxa_crossover': round(gerador.uniform(*espaco['taxa_crossover']), 3),
+            'taxa_mutacao': round(math.exp(gerador.uniform(math.log(menor_mutacao), math.log(maior_mutacao))), 4),
+            'funcao_selecao': gerador.choice(espaco['funcao_selecao']),
+            'limite_sem_melhora': gerador.choice(espaco['limite_sem_melhora']),
+        })
+    return configuracoes
+
+def para_params_ag(configuracao):
+    """
+    Converte uma configuração sorteada no dicionário params_ag usado por algoritmo_genetico.
+
+    Args:
+        configuracao: Dicionário de parâmetros com a função de seleção representada pelo nome.
+
+    Returns:
+        Um novo dicionário com a função de seleção correspondente.
+    """
+    return dict(configuracao, funcao_selecao=SELECOES[configuracao['funcao_selecao']])
+
+def _avaliar_configuracao(argumentos):
+    """Executa o AG com uma configuração em uma instância e retorna (valor, tempo)."""
+    configuracao, (dados_conteineres, max_peso, max_volume), limite_tempo, semente = argumentos
+    random.seed(semente)
+    inicio = time.perf_counter()
+    melhor = algoritmo_genetico(dados_conteineres, max_peso, max_volume, False,
+                                limite_tempo=limite_tempo, **para_params_ag(configuracao))
+    return melhor.fitness, time.perf_counter() - inicio
+
+def _ranks_por_bloco(valores, tempos):
+    """
+    Ordena as configurações dentro de cada bloco (linha): maior valor primeiro e,
+    em caso de empate no valor, menor tempo. Empates completos recebem o rank médio.
+    """
+    ranks = np.empty(valores.shape)
+    for bloco in range(valores.shape[0]):
+        chaves = list(zip(-valores[bloco], tempos[bloco]))
+        ordem = sorted(range(len(chaves)), key=lambda j: chaves[j])
+        posicao = 0
+        while posicao < len(ordem):
+            fim = posicao
+            while fim + 1 < len(ordem) and chaves[ordem[fim + 1]] == chaves[ordem[posicao]]:
+                fim += 1
+            for k in range(posicao, fim + 1):
+                ranks[bloco, ordem[k]] = (posicao + fim) / 2 + 1
+            posicao = fim + 1
+    return ranks
+
+def teste_friedman(ranks):
+    """
+    Aplica o teste de Friedman a uma matriz de ranks (blocos x configurações).
+
+    O p-valor usa a aproximação de Wilson-Hilferty da distribuição qui-quadrado, que
+    dispensa dependências além da biblioteca padrão.
+
+    Args:
+        ranks: Matriz com o rank de cada configuração em cada bloco.
+
+    Returns:
+        O p-valor da hipótese de que todas as configurações têm o mesmo desempenho.
+    """
+    num_blocos, num_configuracoes = ranks.shape
+    somas = ranks.sum(axis=0)
+    estatistica = (12 / (num_blocos * num_configuracoes * (num_configuracoes + 1)) * (somas ** 2).sum()
+                   - 3 * num_blocos * (num_configuracoes + 1))
+    graus = num_configuracoes - 1
+    if estatistica <= 0:
+        return 1.0
+    z = ((estatistica / graus) ** (1 / 3) - (1 - 2 / (9 * graus))) / math.sqrt(2 / (9 * graus))
+    return 1 - NormalDist().cdf(z)
+
+def corrida_parametros(instancias, configuracoes=None, num_configuracoes=24, limite_tempo=1.0,
+                       max_blocos=20, min_blocos=5, alfa=0.05, max_processos=None, semente=0):
+    """
+    Ajusta os parâmetros do AG por corrida (racing) no estilo F-Race.
+
+    A cada bloco, todas as configurações ainda vivas são avaliadas em paralelo na mesma
+    instância e com a mesma semente, cada execução limitada a limite_tempo segundos.
+    Dentro do bloco as configurações são ordenadas pelo valor do frete obtido e, em caso
+    de empate, pelo tempo gasto, o que mede a qualidade alcançada no tempo disponível.
+    A partir de min_blocos, se o teste de Friedman indicar diferença entre as configurações,
+    são eliminadas as que têm soma de ranks significativamente pior que a melhor
+    (comparação pós-teste com aproximação normal). A corrida termina quando resta uma única
+    configuração ou após max_blocos blocos.
+
+    Args:
+        instancias: Lista de tuplas (dados_conteineres, max_peso, max_volume) usadas em rodízio.
+        configuracoes: Lista de configurações a comparar; se None, são sorteadas por gerar_configuracoes.
+        num_configuracoes: Número de configurações sorteadas quando configuracoes é None.
+        limite_tempo: Tempo máximo, em segundos, de cada execução do AG.
+        max_blocos: Número máximo de blocos (instância + semente) avaliados.
+        min_blocos: Número de blocos avaliados antes do primeiro teste estatístico.
+        alfa: Nível de significância dos testes.
+        max_processos: Número de processos em paralelo; None usa todos os núcleos.
+        semente: Semente do sorteio das configurações e das execuções.
+
+    Returns:
+        Uma tupla contendo:
+            - O dicionário params_ag da melhor configuração, pronto para algoritmo_genetico.
+            - Uma lista de dicionários, um por configuração, com as chaves 'configuracao',
+              'blocos' (blocos avaliados), 'valor_medio', 'tempo_medio', 'rank_medio' e
+              'eliminada' (se foi eliminada antes do fim da corrida).
+    """
+    if configuracoes is None:
+        configuracoes = gerar_configuracoes(num_configuracoes, semente=semente)
+    num_configuracoes = len(configuracoes)
+    valores = np.full((max_blocos, num_configuracoes), np.nan)
+    tempos = np.full((max_blocos, num_configuracoes), np.nan)
+    vivas = list(range(num_configuracoes))
+    z_critico = NormalDist().inv_cdf(1 - alfa / 2)
+
+    with ProcessPoolExecutor(max_workers=max_processos) as executor:
+        for bloco in range(max_blocos):
+            instancia = instancias[bloco % len(instancias)]
+            argumentos = [(configuracoes[j], instancia, limite_tempo, semente + bloco) for j in vivas]
+            for j, (valor, tempo) in zip(vivas, executor.map(_avaliar_configuracao, argumentos)):
+                valores[bloco, j] = valor
+                tempos[bloco, j] = tempo
+
+            num_blocos = bloco + 1
+            if num_blocos < min_blocos or len(vivas) == 1:
+                continue
+            ranks = _ranks_por_bloco(valores[:num_blocos, vivas], tempos[:num_blocos, vivas])
+            if teste_friedman(ranks) >= alfa:
+                continue
+            somas = ranks.sum(axis=0)
+            diferenca_critica = z_critico * math.sqrt(num_blocos * len(vivas) * (len(vivas) + 1) / 6)
+            vivas = [j for j, soma in zip(vivas, somas) if soma - somas.min() <= diferenca_critica]
+            print(f"Bloco {num_blocos}: {len(vivas)} configurações restantes.")
+            if len(vivas) == 1:
+                break
+
+    ranks = _ranks_por_bloco(valores[:num_blocos, vivas], tempos[:num_blocos, vivas])
+    melhor = vivas[int(np.argmin(ranks.mean(axis=0)))]
+    rank_medio = dict(zip(vivas, ranks.mean(axis=0).tolist()))
+
+    resumo = []
+    for j, configuracao in enumerate(configuracoes):
+        avaliados = ~np.isnan(valores[:, j])
+        resumo.append({
+            'configuracao': configuracao,
+            'blocos': int(avaliados.sum()),
+            'valor_medio': float(valores[avaliados, j].mean()),
+            'tempo_medio': float(tempos[avaliados, j].mean()),
+            'rank_medio': rank_medio.get(j),
+            'eliminada': j not in vivas,
+        })
+    return para_params_ag(configuracoes[melhor]), resumo
@@ -1,4 +1,5 @@
 import random
+import time
 import pygame
 
 # Classe Individuo
@@ -85,18 +86,29 @@ def desenhar_solucao(tela, solucao, dados_conteineres, max_peso, max_volume, ger
     pygame.display.flip()  # Atualiza a tela
 
 
-def inicializar_populacao(tamanho_populacao, tamanho_genoma):
+def inicializar_populacao(tamanho_populacao, tamanho_genoma, sementes=None, num_navios=1):
     """
     Inicializa a população do algoritmo genético com indivíduos aleatórios.
 
     Args:
         tamanho_populacao: O número de indivíduos na população.
         tamanho_genoma: O tamanho do genoma de cada indivíduo.
+        sementes: Lista opcional de genomas (ex: soluções de heurísticas) que entram na
+            população inicial no lugar de indivíduos aleatórios.
+        num_navios: Número de navios. Com mais de um navio cada gene é um inteiro entre
+            0 (não carregado) e num_navios, indicando o navio que recebe o contêiner.
 
     Returns:
         Uma lista de objetos Individuo, representando a população inicial.
     """
-    return [Individuo([random.choice([0, 1]) for _ in range(tamanho_genoma)]) for _ in range(tamanho_populacao)]
+    if num_navios == 1:
+        gerar_gene = lambda: random.choice([0, 1])
+    else:
+        gerar_gene = lambda: random.randint(0, num_navios)
+    populacao = [Individuo(list(genoma)) for genoma in (sementes or [])[:tamanho_populacao]]
+    populacao.extend(Individuo([gerar_gene() for _ in range(tamanho_genoma)])
+                     for _ in range(tamanho_populacao - len(populacao)))
+    return populacao
 
 def calcular_fitness(individuo, dados_conteineres, max_peso, max_volume):
     """
@@ -222,25 +234,32 @@ def crossover_dois_pontos(pai1, pai2):
     filho2_genoma = pai2.genoma[:ponto1] + pai1.genoma[ponto1:ponto2] + pai2.genoma[ponto2:]
     return Individuo(filho1_genoma), Individuo(filho2_genoma)
 
-def mutacao(individuo, taxa_mutacao):
+def mutacao(individuo, taxa_mutacao, num_navios=1):
     """
     Realiza a mutação em um indivíduo com uma determinada taxa.
 
     A mutação percorre cada gene (bit) do genoma do indivíduo.
     Para cada gene, um número aleatório entre 0 e 1 é gerado.
     Se esse número for menor que a taxa de mutação, o gene é invertido (0 vira 1 e vice-versa).
+    Com mais de um navio, o gene mutado passa a indicar outro destino escolhido
+    aleatoriamente (outro navio ou não carregado).
 
     Args:
         individuo: O indivíduo (objeto Individuo) a ser mutado.
         taxa_mutacao: A probabilidade de cada gene ser mutado.
+        num_navios: Número de navios representados no genoma.
     """
     for i in range(len(individuo.genoma)):
         if random.random() < taxa_mutacao:
-            individuo.genoma[i] = 1 - individuo.genoma[i]
+            if num_navios == 1:
+                individuo.genoma[i] = 1 - individuo.genoma[i]
+            else:
+                novo_gene = random.randrange(num_navios)
+                individuo.genoma[i] = novo_gene + 1 if novo_gene >= individuo.genoma[i] else novo_gene
 
 def algoritmo_genetico(dados_conteineres, max_peso, max_volume, visualizar,
                        tamanho_populacao, num_geracoes, taxa_crossover, taxa_mutacao,
-                       funcao_selecao, limite_sem_melhora=100):
+                       funcao_selecao, limite_sem_melhora=100, sementes=None, limite_tempo=None):
     """
     Executa o algoritmo genético para encontrar a melhor solução para o problema de carregamento de contêineres.
 
@@ -255,9 +274,12 @@ def algoritmo_genetico(dados_conteineres, max_peso, max_volume, visualizar,
         taxa_mutacao: Probabilidade de mutação de um gene.
         funcao_selecao: Função de seleção a ser utilizada (ex: selecao_torneio, selecao_roleta).
         limite_sem_melhora: Indica uma condição de parada no algoritmo se ele ficar mais de N gerações sem ter uma melhor solução.
+        sementes: Lista opcional de genomas incluídos na população inicial (ex: a solução da Gulosa Surrogada).
+        limite_tempo: Tempo máximo de execução em segundos; None para não limitar.
 
     Returns:
         Objeto Individuo representando o melhor indivíduo encontrado após a execução do algoritmo.
+        O atributo geracoes do indivíduo indica quantas gerações foram avaliadas.
     """
 
     # Inicialição do pygame para visualização do processamento do algorítimo.
@@ -267,8 +289,9 @@ def algoritmo_genetico(dados_conteineres, max_peso, max_volume, visualizar,
         tela = pygame.display.set_mode((800, 600))
         pygame.display.set_caption("Visualização do Algoritmo Genético")
 
+    inicio = time.perf_counter()
     tamanho_genoma = len(dados_conteineres)
-    populacao = inicializar_populacao(tamanho_populacao, tamanho_genoma)
+    populacao = inicializar_populacao(tamanho_populacao, tamanho_genoma, sementes)
     melhor_global = None
     geracoes_sem_melhora = 0  # Contador de gerações sem melhoria
 
@@ -293,6 +316,11 @@ def algoritmo_genetico(dados_conteineres, max_peso, max_volume, visualizar,
             print(f"Parando na geração {geracao} após {limite_sem_melhora} gerações sem melhoria.")
             break
 
+        # Condição de parada: se o tempo máximo de execução for atingido
+        if limite_tempo is not None and time.perf_counter() - inicio >= limite_tempo:
+            print(f"Parando na geração {geracao} após atingir o limite de {limite_tempo} segundos.")
+            break
+
         # Visualização
         if visualizar:
             desenhar_solucao(tela, melhor_global, dados_conteineres, max_peso, max_volume, geracao)
@@ -304,6 +332,7 @@ def algoritmo_genetico(dados_conteineres, max_peso, max_volume, visualizar,
             for evento in pygame.event.get():
                 if evento.type == pygame.QUIT:
                     pygame.quit()
+                    melhor_global.geracoes = geracao + 1
                     return melhor_global # Sai do algoritmo se a janela for fechada
 
         # Cria a próxima geração
@@ -329,4 +358,5 @@ def algoritmo_genetico(dados_conteineres, max_peso, max_volume, visualizar,
         pygame.quit()
 
     # Retorna o melhor indivíduo encontrado em todas as gerações
+    melhor_global.geracoes = geracao + 1
     return melhor_global
@@ -0,0 +1,159 @@
+import random
+import numpy as np
+from algoritmo_genetico import Individuo, inicializar_populacao, crossover_dois_pontos, mutacao
+
+def calcular_cargas_populacao(genomas, pesos, volumes, num_navios):
+    """
+    Calcula, de uma só vez, o peso e o volume carregados em cada navio por cada indivíduo.
+
+    As cargas são acumuladas com uma soma por índice (scatter-add) em matrizes
+    navios x população: o contêiner i do indivíduo p soma seu peso na posição
+    (genomas[p, i], p). A linha 0 acumula os contêineres não carregados.
+
+    Args:
+        genomas: Array inteiro (população x contêineres) com o navio de cada contêiner.
+        pesos: Array com o peso de cada contêiner.
+        volumes: Array com o volume de cada contêiner.
+        num_navios: Número de navios.
+
+    Returns:
+        Uma tupla contendo:
+            - Matriz (num_navios + 1) x população com o peso carregado em cada navio.
+            - Matriz (num_navios + 1) x população com o volume carregado em cada navio.
+    """
+    tamanho_populacao = genomas.shape[0]
+    posicoes = (genomas * tamanho_populacao + np.arange(tamanho_populacao)[:, None]).ravel()
+    tamanho = (num_navios + 1) * tamanho_populacao
+    carga_peso = np.bincount(posicoes, weights=np.broadcast_to(pesos, genomas.shape).ravel(), minlength=tamanho)
+    carga_volume = np.bincount(posicoes, weights=np.broadcast_to(volumes, genomas.shape).ravel(), minlength=tamanho)
+    return (carga_peso.reshape(num_navios + 1, tamanho_populacao),
+            carga_volume.reshape(num_navios + 1, tamanho_populacao))
+
+def calcular_fitness_populacao(genomas, pesos, volumes, valores, capacidades):
+    """
+    Calcula o fitness de toda a população para o carregamento de vários navios.
+
+    Assim como no AG de um navio, o fitness é o valor total dos contêineres carregados
+    (em qualquer navio) e vale 0 se algum navio exceder seu peso ou volume máximo.
+
+    Args:
+        genomas: Array inteiro (população x contêineres) com o navio de cada contêiner.
+        pesos: Array com o peso de cada contêiner.
+        volumes: Array com o volume de cada contêiner.
+        valores: Array com o valor de cada contêiner.
+        capacidades: Array (navios x 2) com o peso e o volume máximos de cada navio.
+
+    Returns:
+        Um array com o fitness de cada indivíduo.
+    """
+    carga_peso, carga_volume = calcular_cargas_populacao(genomas, pesos, volumes, len(capacidades))
+    validos = ((carga_peso[1:] <= capacidades[:, 0, None]).all(axis=0)
+               & (carga_volume[1:] <= capacidades[:, 1, None]).all(axis=0))
+    valor_carregado = (genomas > 0) @ valores
+    return np.where(validos, valor_carregado, 0)
+
+def reparar_populacao(genomas, pesos, volumes, valores, capacidades):
+    """
+    Repara os indivíduos que excedem a capacidade de algum navio.
+
+    Para cada navio sobrecarregado, os contêineres nele são ordenados do pior para o
+    melhor pela razão valor / consumo (peso e volume normalizados pela capacidade do navio)
+    e descarregados nessa ordem até que o navio respeite peso e volume.
+
+    Args:
+        genomas: Array inteiro (população x contêineres), alterado no próprio array.
+        pesos: Array com o peso de cada contêiner.
+        volumes: Array com o volume de cada contêiner.
+        valores: Array com o valor de cada contêiner.
+        capacidades: Array (navios x 2) com o peso e o volume máximos de cada navio.
+    """
+    carga_peso, carga_volume = calcular_cargas_populacao(genomas, pesos, volumes, len(capacidades))
+    excesso_peso = carga_peso[1:] - capacidades[:, 0, None]
+    excesso_volume = carga_volume[1:] - capacidades[:, 1, None]
+    for navio, individuo in zip(*np.nonzero((excesso_peso > 0) | (excesso_volume > 0))):
+        no_navio = np.flatnonzero(genomas[individuo] == navio + 1)
+        consumo = pesos[no_navio] / capacidades[navio, 0] + volumes[no_navio] / capacidades[navio, 1]
+        piores = no_navio[np.argsort(valores[no_navio] / np.maximum(consumo, 1e-12), kind="stable")]
+        # Descarrega o menor prefixo dos piores que elimina os dois excessos
+        resolvido = ((np.cumsum(pesos[piores]) >= excesso_peso[navio, individuo])
+                     & (np.cumsum(volumes[piores]) >= excesso_volume[navio, individuo]))
+        genomas[individuo, piores[:int(np.argmax(resolvido)) + 1]] = 0
+
+def algoritmo_genetico_multinavio(dados_conteineres, capacidades, tamanho_populacao, num_geracoes,
+                                  taxa_crossover, taxa_mutacao, funcao_selecao, limite_sem_melhora=100,
+                                  reparar=True, sementes=None):
+    """
+    Executa o algoritmo genético para distribuir os contêineres entre vários navios.
+
+    O genoma tem um gene inteiro por contêiner: 0 indica que o contêiner não é carregado
+    e k indica que ele vai no navio k. Os operadores de seleção, crossover e mutação são os
+    mesmos do AG de um navio; a avaliação é feita para toda a população de uma vez.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        capacidades: Lista de tuplas (max_peso, max_volume), uma por navio.
+        tamanho_populacao: Número de indivíduos na população.
+        num_geracoes: Número de gerações a serem evoluídas.
+        taxa_crossover: Probabilidade de crossover entre dois pais.
+        taxa_mutacao: Probabilidade de mutação de um gene.
+        funcao_selecao: Função de seleção a ser utilizada (ex: selecao_torneio, selecao_roleta).
+        limite_sem_melhora: Indica uma condição de parada no algoritmo se ele ficar mais de N gerações sem ter uma melhor solução.
+        reparar: Se True, indivíduos que excedem a capacidade de algum navio são reparados
+            antes da avaliação, em vez de receberem fitness 0.
+        sementes: Lista opcional de genomas incluídos na população inicial (ex: a solução da Gulosa multinavio).
+
+    Returns:
+        Objeto Individuo representando o melhor indivíduo encontrado após a execução do algoritmo.
+    """
+    dados = np.asarray(dados_conteineres, dtype=float).reshape(-1, 3)
+    pesos, volumes, valores = dados[:, 0], dados[:, 1], dados[:, 2]
+    capacidades = np.asarray(capacidades, dtype=float).reshape(-1, 2)
+    num_navios = len(capacidades)
+
+    populacao = inicializar_populacao(tamanho_populacao, len(dados), sementes, num_navios)
+    melhor_global = None
+    geracoes_sem_melhora = 0  # Contador de gerações sem melhoria
+
+    for geracao in range(num_geracoes):
+        # Avalia a população atual de uma só vez
+        genomas = np.array([individuo.genoma for individuo in populacao], dtype=np.intp)
+        if reparar:
+            reparar_populacao(genomas, pesos, volumes, valores, capacidades)
+        fitness = calcular_fitness_populacao(genomas, pesos, volumes, valores, capacidades)
+        for individuo, genoma, valor in zip(populacao, genomas.tolist(), fitness.tolist()):
+            individuo.genoma = genoma
+            individuo.fitness = valor
+
+        # Seleciona o melhor indivíduo da geração atual
+        melhor_atual = populacao[int(np.argmax(fitness))]
+
+        # Atualiza o melhor global, se necessário
+        if melhor_global is None or melhor_atual.fitness > melhor_global.fitness:
+            melhor_global = Individuo(list(melhor_atual.genoma))
+            melhor_global.fitness = melhor_atual.fitness
+            geracoes_sem_melhora = 0
+        else:
+            geracoes_sem_melhora += 1
+
+        # Condição de parada: se não houver melhoria por N gerações
+        if geracoes_sem_melhora >= limite_sem_melhora:
+            print(f"Parando na geração {geracao} após {limite_sem_melhora} gerações sem melhoria.")
+            break
+
+        # Cria a próxima geração
+        nova_populacao = []
+        while len(nova_populacao) < tamanho_populacao:
+            if taxa_crossover == 1 or random.random() < taxa_crossover:
+                pai1, pai2 = funcao_selecao(populacao), funcao_selecao(populacao)
+                filho1, filho2 = crossover_dois_pontos(pai1, pai2)
+                nova_populacao.extend([filho1, filho2])
+            else:
+                nova_populacao.append(Individuo(list(funcao_selecao(populacao).genoma)))
+
+        # Aplica mutação na nova população
+        for individuo in nova_populacao:
+            mutacao(individuo, taxa_mutacao, num_navios)
+
+        populacao = nova_populacao[:tamanho_populacao]
+
+    return melhor_global
@@ -0,0 +1,210 @@
+import random
+import numpy as np
+from algoritmo_genetico import Individuo, inicializar_populacao, crossover_dois_pontos, mutacao
+
+def calcular_objetivos_populacao(genomas, pesos, volumes, valores, max_peso, max_volume):
+    """
+    Calcula os objetivos e a violação das restrições de toda a população de uma vez.
+
+    Todos os objetivos são maximizados:
+        - Valor total do frete.
+        - Utilização média da capacidade: média entre peso / max_peso e volume / max_volume.
+        - Equilíbrio da carga: o negativo da diferença absoluta entre a utilização do peso
+          e a do volume (0 quando os dois recursos são ocupados na mesma proporção).
+
+    Args:
+        genomas: Array binário (população x contêineres).
+        pesos: Array com o peso de cada contêiner.
+        volumes: Array com o volume de cada contêiner.
+        valores: Array com o valor de cada contêiner.
+        max_peso: Peso máximo que o navio pode carregar.
+        max_volume: Volume máximo que o navio pode carregar.
+
+    Returns:
+        Uma tupla contendo:
+            - Matriz população x 3 com os objetivos de cada indivíduo.
+            - Array com a violação de cada indivíduo (0 se respeita peso e volume).
+    """
+    utilizacao_peso = genomas @ pesos / max_peso
+    utilizacao_volume = genomas @ volumes / max_volume
+    objetivos = np.column_stack([
+        genomas @ valores,
+        (utilizacao_peso + utilizacao_volume) / 2,
+        -np.abs(utilizacao_peso - utilizacao_volume),
+    ])
+    violacao = np.maximum(utilizacao_peso - 1, 0) + np.maximum(utilizacao_volume - 1, 0)
+    return objetivos, violacao
+
+def ordenacao_nao_dominada(objetivos, violacao):
+    """
+    Classifica a população em frentes de Pareto (ordenação rápida do NSGA-II).
+
+    A relação de dominância com restrições é calculada para todos os pares de uma vez:
+    uma solução válida domina qualquer inválida, entre inválidas domina a de menor violação
+    e entre válidas vale a dominância de Pareto usual. As frentes são então removidas uma a
+    uma, descontando de cada solução quantas das soluções removidas a dominavam.
+
+    As matrizes população x população são acumuladas um objetivo por vez, com operações
+    no próprio array e um único array auxiliar, de modo que a memória não cresce com o
+    número de objetivos (cerca de 300 MB para uma união de 10 mil indivíduos).
+
+    Args:
+        objetivos: Matriz população x objetivos (todos maximizados).
+        violacao: Array com a violação das restrições de cada indivíduo.
+
+    Returns:
+        Um array com o índice da frente de cada indivíduo (0 é a frente não dominada).
+    """
+    tamanho = len(objetivos)
+    domina = np.ones((tamanho, tamanho), dtype=bool)  # Ao menos tão bom em todos os objetivos
+    maior = np.zeros((tamanho, tamanho), dtype=bool)  # Estritamente melhor em algum objetivo
+    auxiliar = np.empty((tamanho, tamanho), dtype=bool)
+    for objetivo in objetivos.T:
+        domina &= np.greater_equal(objetivo[:, None], objetivo[None, :], out=auxiliar)
+        maior |= np.greater(objetivo[:, None], objetivo[None, :], out=auxiliar)
+    domina &= maior
+    validos = violacao == 0
+    domina &= validos[:, None]
+    domina &= validos[None, :]
+    domina |= np.less(violacao[:, None], violacao[None, :], out=auxiliar)
+    del maior, auxiliar
+
+    num_dominadores = domina.sum(axis=0)
+    frentes = np.full(len(objetivos), -1)
+    atual = np.flatnonzero(num_dominadores == 0)
+    frente = 0
+    while atual.size:
+        frentes[atual] = frente
+        num_dominadores -= domina[atual].sum(axis=0)
+        num_dominadores[atual] = -1  # Já classificados
+        atual = np.flatnonzero(num_dominadores == 0)
+        frente += 1
+    return frentes
+
+def distancia_aglomeracao(objetivos, frentes):
+    """
+    Calcula a distância de aglomeração (crowding distance) de cada indivíduo na sua frente.
+
+    Args:
+        objetivos: Matriz população x objetivos.
+        frentes: Array com o índice da frente de cada indivíduo.
+
+    Returns:
+        Um array com a distância de aglomeração de cada indivíduo. Os extremos de cada
+        objetivo em cada frente recebem distância infinita.
+    """
+    distancias = np.zeros(len(objetivos))
+    for frente in np.unique(frentes):
+        membros = np.flatnonzero(frentes == frente)
+        if len(membros) <= 2:
+            distancias[membros] = np.inf
+            continue
+        valores_frente = objetivos[membros]
+        ordens = np.argsort(valores_frente, axis=0, kind="stable")
+        ordenados = np.take_along_axis(valores_frente, ordens, axis=0)
+        amplitude = ordenados[-1] - ordenados[0]
+        amplitude[amplitude == 0] = 1
+        contribuicao = np.zeros_like(ordenados)
+        contribuicao[1:-1] = (ordenados[2:] - ordenados[:-2]) / amplitude
+        contribuicao[[0, -1]] = np.inf
+        soma = np.zeros(len(membros))
+        for objetivo in range(objetivos.shape[1]):
+            soma[ordens[:, objetivo]] += contribuicao[:, objetivo]
+        distancias[membros] = soma
+    return distancias
+
+def selecao_torneio_aglomeracao(populacao, frentes, distancias):
+    """
+    Seleciona um indivíduo por torneio binário com o operador de comparação do NSGA-II.
+
+    Vence o indivíduo da melhor frente; em caso de empate, o de maior distância de aglomeração.
+
+    Args:
+        populacao: Lista de indivíduos (objetos Individuo).
+        frentes: Array com o índice da frente de cada indivíduo.
+        distancias: Array com a distância de aglomeração de cada indivíduo.
+
+    Returns:
+        Individuo selecionado.
+    """
+    i, j = random.sample(range(len(populacao)), 2)
+    if (frentes[i], -distancias[i]) <= (frentes[j], -distancias[j]):
+        return populacao[i]
+    return populacao[j]
+
+def algoritmo_genetico_pareto(dados_conteineres, max_peso, max_volume, tamanho_populacao, num_geracoes,
+                              taxa_crossover, taxa_mutacao):
+    """
+    Executa um algoritmo genético multiobjetivo no estilo NSGA-II.
+
+    Em vez de uma única solução, o algoritmo devolve a frente de Pareto que equilibra
+    valor do frete, utilização da capacidade e equilíbrio entre peso e volume (ver
+    calcular_objetivos_populacao). A cada geração, pais e filhos são unidos, classificados
+    pela ordenação não dominada e pela distância de aglomeração, e os melhores formam a
+    próxima população. O crossover e a mutação são os mesmos do AG de um objetivo.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        max_peso: Peso máximo que o navio pode carregar.
+        max_volume: Volume máximo que o navio pode carregar.
+        tamanho_populacao: Número de indivíduos na população.
+        num_geracoes: Número de gerações a serem evoluídas.
+        taxa_crossover: Probabilidade de crossover entre dois pais.
+        taxa_mutacao: Probabilidade de mutação de um gene.
+
+    Returns:
+        Uma lista de objetos Individuo com as soluções válidas e distintas da frente de Pareto,
+        ordenadas por valor decrescente. Cada indivíduo tem o valor total em fitness e a tupla
+        (valor, utilização, equilíbrio) em objetivos.
+    """
+    dados = np.asarray(dados_conteineres, dtype=float).reshape(-1, 3)
+    pesos, volumes, valores = dados[:, 0], dados[:, 1], dados[:, 2]
+
+    def avaliar(populacao):
+        genomas = np.array([individuo.genoma for individuo in populacao], dtype=float)
+        return calcular_objetivos_populacao(genomas, pesos, volumes, valores, max_peso, max_volume)
+
+    populacao = inicializar_populacao(tamanho_populacao, len(dados))
+    objetivos, violacao = avaliar(populacao)
+    frentes = ordenacao_nao_dominada(objetivos, violacao)
+    distancias = distancia_aglomeracao(objetivos, frentes)
+
+    for _ in range(num_geracoes):
+        # Cria os filhos com seleção por torneio de aglomeração, crossover e mutação
+        filhos = []
+        while len(filhos) < tamanho_populacao:
+            pai1 = selecao_torneio_aglomeracao(populacao, frentes, distancias)
+            pai2 = selecao_torneio_aglomeracao(populacao, frentes, distancias)
+            if taxa_crossover == 1 or random.random() < taxa_crossover:
+                filhos.extend(crossover_dois_pontos(pai1, pai2))
+            else:
+                filhos.extend([Individuo(list(pai1.genoma)), Individuo(list(pai2.genoma))])
+        filhos = filhos[:tamanho_populacao]
+        for individuo in filhos:
+            mutacao(individuo, taxa_mutacao)
+
+        # Seleção elitista sobre a união de pais e filhos
+        uniao = populacao + filhos
+        objetivos_filhos, violacao_filhos = avaliar(filhos)
+        objetivos = np.vstack([objetivos, objetivos_filhos])
+        violacao = np.concatenate([violacao, violacao_filhos])
+        frentes = ordenacao_nao_dominada(objetivos, violacao)
+        distancias = distancia_aglomeracao(objetivos, frentes)
+        sobreviventes = np.lexsort((-distancias, frentes))[:tamanho_populacao]
+
+        populacao = [uniao[i] for i in sobreviventes]
+        objetivos, violacao = objetivos[sobreviventes], violacao[sobreviventes]
+        frentes, distancias = frentes[sobreviventes], distancias[sobreviventes]
+
+    frente_pareto = []
+    genomas_vistos = set()
+    for i in np.flatnonzero((frentes == 0) & (violacao == 0)):
+        genoma = tuple(populacao[i].genoma)
+        if genoma in genomas_vistos:
+            continue
+        genomas_vistos.add(genoma)
+        individuo = Individuo(list(genoma))
+        individuo.fitness = objetivos[i, 0].item()
+        individuo.objetivos = tuple(objetivos[i].tolist())
+        frente_pareto.append(individuo)
+    return sorted(frente_pareto, key=lambda individuo: individuo.fitness, reverse=True)
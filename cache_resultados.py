@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import pickle
+
+PASTA_CACHE = os.path.join('resultados', 'cache')
+TAMANHO_MAXIMO_CACHE = 100 * 1024 * 1024  # 100 MB
+
+# Incrementar sempre que uma mudança nos algoritmos invalidar os resultados já armazenados
+VERSAO_CACHE = 2
+
+def _serializar(objeto):
+    """Converte para JSON os objetos que o módulo json não sabe representar."""
+    if callable(objeto):
+        # Funções (ex: funcao_selecao) são identificadas pelo nome
+        return f"{objeto.__module__}.{objeto.__qualname__}"
+    if hasattr(objeto, 'tolist'):
+        # Arrays e escalares do NumPy
+        return objeto.tolist()
+    raise TypeError(f"Objeto do tipo {type(objeto).__name__} não pode compor a chave do cache")
+
+def chave_cache(dados_conteineres, capacidades, algoritmo, parametros, semente):
+    """
+    Calcula a chave de cache de uma execução a partir de tudo o que determina seu resultado.
+
+    A chave é o hash SHA-256 de uma representação JSON canônica da instância, das
+    capacidades, do nome do algoritmo, dos seus parâmetros e da semente aleatória.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        capacidades: Capacidades do navio (ex: (max_peso, max_volume) ou uma lista por navio).
+        algoritmo: Nome do algoritmo executado.
+        parametros: Dicionário com os parâmetros do algoritmo.
+        semente: Semente aleatória usada na execução (ou None).
+
+    Returns:
+        A chave do cache em hexadecimal.
+    """
+    conteudo = json.dumps({
+        "versao": VERSAO_CACHE,
+        "dados": dados_conteineres,
+        "capacidades": capacidades,
+        "algoritmo": algoritmo,
+        "parametros": parametros,
+        "semente": semente,
+    }, sort_keys=True, default=_serializar)
+    return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+
+def obter_resultado(pasta_cache, chave):
+    """
+    Busca um resultado no cache.
+
+    A data de modificação do arquivo é atualizada a cada acerto, de modo que a remoção
+    por tamanho descarte primeiro os resultados usados há mais tempo.
+
+    Args:
+        pasta_cache: Pasta onde os resultados são armazenados.
+        chave: Chave calculada por chave_cache.
+
+    Returns:
+        O resultado armazenado, ou None se a chave não estiver no cache.
+    """
+    caminho = os.path.join(pasta_cache, f"{chave}.pkl")
+    try:
+        with open(caminho, 'rb') as arquivo:
+            resultado = pickle.load(arquivo)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    os.utime(caminho)
+    return resultado
+
+def salvar_resultado(pasta_cache, chave, resultado, tamanho_maximo=TAMANHO_MAXIMO_CACHE):
+    """
+    Armazena um resultado no cache e remove os mais antigos se o tamanho máximo for excedido.
+
+    Args:
+        pasta_cache: Pasta onde os resultados são armazenados.
+        chave: Chave calculada por chave_cache.
+        resultado: Objeto a ser armazenado (soluções, métricas e tempos).
+        tamanho_maximo: Tamanho máximo, em bytes, ocupado pela pasta do cache.
+    """
+    if not os.path.exists(pasta_cache):
+        os.makedirs(pasta_cache)
+
+    # Escreve em um arquivo temporário para nunca deixar uma entrada incompleta
+    caminho = os.path.join(pasta_cache, f"{chave}.pkl")
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, 'wb') as arquivo:
+        pickle.dump(resultado, arquivo)
+    os.replace(temporario, caminho)
+
+    remover_excedente(pasta_cache, tamanho_maximo)
+
+def remover_excedente(pasta_cache, tamanho_maximo=TAMANHO_MAXIMO_CACHE):
+    """
+    Remove os resultados usados há mais tempo até que o cache caiba no tamanho máximo.
+
+    Args:
+        pasta_cache: Pasta onde os resultados são armazenados.
+        tamanho_maximo: Tamanho máximo, em bytes, ocupado pela pasta do cache.
+    """
+    entradas = []
+    for nome in os.listdir(pasta_cache):
+        if nome.endswith('.pkl'):
+            estado = os.stat(os.path.join(pasta_cache, nome))
+            entradas.append((estado.st_mtime, estado.st_size, nome))
+
+    tamanho_total = sum(tamanho for _, tamanho, _ in entradas)
+    for _, tamanho, nome in sorted(entradas):
+        if tamanho_total <= tamanho_maximo:
+            break
+        try:
+            os.remove(os.path.join(pasta_cache, nome))
+        except FileNotFoundError:
+            pass
+        tamanho_total -= tamanho
+
+def executar_com_cache(pasta_cache, chave, funcao):
+    """
+    Retorna o resultado armazenado para a chave ou executa a função e armazena o resultado.
+
+    Args:
+        pasta_cache: Pasta onde os resultados são armazenados, ou None para desativar o cache.
+        chave: Chave calculada por chave_cache.
+        funcao: Função sem argumentos que calcula o resultado.
+
+    Returns:
+        O resultado armazenado ou recém-calculado.
+    """
+    if pasta_cache is None:
+        return funcao()
+    resultado = obter_resultado(pasta_cache, chave)
+    if resultado is None:
+        resultado = funcao()
+        salvar_resultado(pasta_cache, chave, resultado)
+    return resultado
@@ -1,3 +1,6 @@
+import itertools
+import numpy as np
+
 def heuristica_gulosa(dados_conteineres, max_peso, max_volume):
     """
     Implementa a heurística gulosa para o problema de carregamento de contêineres.
@@ -37,3 +40,274 @@ def heuristica_gulosa(dados_conteineres, max_peso, max_volume):
             valor_total += valor
 
     return conteineres_selecionados, peso_total, volume_total, valor_total
+
+def _preencher(ordem, pesos, volumes, max_peso, max_volume):
+    """
+    Carrega os contêineres de uma ordem de prioridade enquanto couberem no navio.
+
+    O resultado é exatamente o da Heurística Gulosa original: os contêineres são percorridos
+    na ordem e carregados sempre que ainda cabem. Cada iteração filtra os contêineres que
+    cabem individualmente na capacidade residual e carrega de uma vez o maior prefixo deles
+    que cabe em conjunto, de modo que o laço executa poucas operações vetoriais.
+
+    Args:
+        ordem: Array com os índices dos contêineres na ordem de prioridade.
+        pesos: Array com o peso de cada contêiner.
+        volumes: Array com o volume de cada contêiner.
+        max_peso: Peso disponível no navio.
+        max_volume: Volume disponível no navio.
+
+    Returns:
+        Uma tupla contendo:
+            - Um array com os índices dos contêineres carregados, na ordem de carregamento.
+            - O peso residual após o carregamento.
+            - O volume residual após o carregamento.
+    """
+    selecionados = [ordem[:0]]
+    peso_residual = max_peso
+    volume_residual = max_volume
+    restantes = ordem
+    while restantes.size:
+        restantes = restantes[(pesos[restantes] <= peso_residual) & (volumes[restantes] <= volume_residual)]
+        if not restantes.size:
+            break
+        quantidade = _tamanho_prefixo(pesos[restantes], volumes[restantes], peso_residual, volume_residual)
+        carregados = restantes[:quantidade]
+        selecionados.append(carregados)
+        peso_residual -= pesos[carregados].sum()
+        volume_residual -= volumes[carregados].sum()
+        restantes = restantes[quantidade:]
+    return np.concatenate(selecionados), peso_residual, volume_residual
+
+def _tamanho_prefixo(pesos, volumes, max_peso, max_volume):
+    """
+    Calcula, ao longo do último eixo, quantos contêineres iniciais cabem juntos no navio.
+
+    Args:
+        pesos: Array com os pesos na ordem de carregamento (uma linha por ordem).
+        volumes: Array com os volumes na mesma ordem.
+        max_peso: Peso máximo que o navio pode carregar.
+        max_volume: Volume máximo que o navio pode carregar.
+
+    Returns:
+        O tamanho do maior prefixo que respeita peso e volume (um valor por linha).
+    """
+    cabe = (np.cumsum(pesos, axis=-1) <= max_peso) & (np.cumsum(volumes, axis=-1) <= max_volume)
+    if cabe.shape[-1] == 0:
+        return np.zeros(cabe.shape[:-1], dtype=int)
+    return np.where(cabe.all(axis=-1), cabe.shape[-1], np.argmin(cabe, axis=-1))
+
+def _ordem_parcial(chaves, topo):
+    """Retorna, em ordem crescente de chave, os índices das topo menores chaves."""
+    if topo >= len(chaves):
+        return np.argsort(chaves)
+    primeiros = np.argpartition(chaves, topo - 1)[:topo]
+    return primeiros[np.argsort(chaves[primeiros])]
+
+def _prefixo_na_faixa(chaves, dados, max_peso, max_volume, inicio, fim):
+    """
+    Calcula o maior prefixo da ordem crescente de chaves que cabe no navio, supondo que
+    ele termina entre as posições inicio e fim da ordem.
+
+    As chaves nas posições inicio e fim são obtidas por partição (sem índices). Os
+    contêineres de chave menor que a de inicio são somados de uma vez, sem ordenar, e
+    apenas os contêineres da faixa entre as duas chaves são ordenados.
+
+    Args:
+        chaves: Array com a chave de ordenação de cada contêiner.
+        dados: Array (contêineres x 3) com peso, volume e valor de cada contêiner.
+        max_peso: Peso máximo que o navio pode carregar.
+        max_volume: Volume máximo que o navio pode carregar.
+        inicio: Posição da ordem a partir da qual o prefixo pode terminar.
+        fim: Posição da ordem até a qual o prefixo pode terminar.
+
+    Returns:
+        Uma tupla (tamanho, valor) do prefixo, ou None se ele não terminar na faixa.
+    """
+    num_conteineres = len(chaves)
+    if fim < num_conteineres:
+        primeiras = np.partition(chaves, fim - 1)[:fim]
+        chave_fim = primeiras[-1]
+    else:
+        primeiras = chaves
+        chave_fim = np.inf
+    chave_inicio = np.partition(primeiras, inicio - 1)[inicio - 1] if inicio > 0 else -np.inf
+
+    base = chaves < chave_inicio
+    peso_base, volume_base, valor_base = base.astype(float) @ dados
+    if peso_base > max_peso or volume_base > max_volume:
+        return None
+    faixa = np.flatnonzero(~base & (chaves <= chave_fim))
+    faixa = faixa[np.argsort(chaves[faixa])]
+    tamanho_base = num_conteineres - len(faixa) - np.count_nonzero(chaves > chave_fim)
+    tamanho = int(_tamanho_prefixo(dados[faixa, 0], dados[faixa, 1], max_peso - peso_base, max_volume - volume_base))
+    if tamanho == len(faixa) and tamanho_base + tamanho < num_conteineres:
+        return None
+    return tamanho_base + tamanho, valor_base + dados[faixa[:tamanho], 2].sum()
+
+def heuristica_gulosa_surrogada(dados_conteineres, max_peso, max_volume, num_multiplicadores=33,
+                                preencher=True, num_preenchimentos=3, multiplicadores=None):
+    """
+    Implementa uma heurística gulosa vetorizada com multiplicadores surrogados.
+
+    Em vez de somar toneladas e metros cúbicos com o mesmo peso, cada contêiner consome
+    lambda * peso / max_peso + (1 - lambda) * volume / max_volume da capacidade do navio,
+    e os contêineres são ordenados pela razão valor / consumo. Para cada valor de lambda
+    entre 0 e 1, a carga é o maior prefixo da ordem que respeita peso e volume. Nenhuma
+    ordem é calculada por completo: como a carga de um lambda tem tamanho parecido com a do
+    anterior, basta ordenar a faixa de posições em torno do tamanho anterior (ver
+    _prefixo_na_faixa). Só as melhores ordens passam pelo preenchimento opcional, que
+    carrega os demais contêineres que ainda cabem, ordenando apenas o início da ordem e,
+    depois dele, os contêineres que cabem na capacidade residual.
+
+    Com n contêineres, k multiplicadores e cargas de m contêineres, o custo é de O(k * n)
+    em partições e somas vetoriais mais a ordenação das faixas (cerca de 20% de m por
+    multiplicador) e de num_preenchimentos ordenações de m contêineres. Em 1 milhão de
+    contêineres, com os parâmetros padrão, a execução leva de 0,6 a 0,9 segundo (cerca de
+    0,15 segundo só na conversão da lista de tuplas), contra cerca de 1 segundo da
+    Heurística Gulosa original; quase todo o tempo está nas k passagens sobre os n
+    contêineres, e não no tamanho da carga.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        max_peso: Peso máximo que o navio pode carregar.
+        max_volume: Volume máximo que o navio pode carregar.
+        num_multiplicadores: Quantidade de valores de lambda avaliados.
+        preencher: Se True, completa a carga com os contêineres que ainda cabem.
+        num_preenchimentos: Quantidade das melhores ordens que passam pelo preenchimento.
+        multiplicadores: Valores de lambda avaliados; se None, são usados num_multiplicadores
+            valores igualmente espaçados entre 0 e 1.
+
+    Returns:
+        Uma tupla contendo:
+            - Uma lista de inteiros representando os índices dos contêineres selecionados.
+            - O peso total dos contêineres selecionados.
+            - O volume total dos contêineres selecionados.
+            - O valor total dos contêineres selecionados.
+    """
+    num_conteineres = len(dados_conteineres)
+    if num_conteineres == 0:
+        return [], 0, 0, 0
+    if isinstance(dados_conteineres, np.ndarray):
+        dados = dados_conteineres.reshape(-1, 3).astype(float)
+    else:
+        # Muito mais rápido que np.asarray para listas longas de tuplas
+        dados = np.fromiter(itertools.chain.from_iterable(dados_conteineres), dtype=float,
+                            count=3 * num_conteineres).reshape(-1, 3)
+    pesos, volumes, valores = dados[:, 0], dados[:, 1], dados[:, 2]
+    if not ((pesos <= max_peso) & (volumes <= max_volume)).any():
+        # Nenhum contêiner cabe sozinho (ex: capacidade 0), como na Gulosa original
+        return [], 0, 0, 0
+    # Capacidade 0 com contêineres de peso ou volume 0 não pode gerar divisões 0 / 0
+    volumes_normalizados = volumes / max(max_volume, 1e-12)
+    diferenca = pesos / max(max_peso, 1e-12) - volumes_normalizados
+    valores_negativos = -valores
+
+    def razoes(lam):
+        # -valor / consumo, calculado sem arrays temporários
+        consumo = diferenca * lam
+        consumo += volumes_normalizados
+        np.maximum(consumo, 1e-12, out=consumo)
+        return np.divide(valores_negativos, consumo, out=consumo)
+
+    # Estimativa inicial de quantos contêineres cabem; depois a faixa acompanha as cargas observadas
+    consumo_medio = (diferenca + 2 * volumes_normalizados).mean() / 2
+    inicio, fim = 0, int(min(num_conteineres, max(64, 2 / max(consumo_medio, 1e-12))))
+    avaliadas = []
+    if multiplicadores is None:
+        multiplicadores = np.linspace(0, 1, num_multiplicadores)
+    for lam in multiplicadores:
+        chaves = razoes(lam)
+        resultado = _prefixo_na_faixa(chaves, dados, max_peso, max_volume, inicio, fim)
+        while resultado is None:
+            inicio, fim = inicio // 2, min(num_conteineres, fim * 2)
+            resultado = _prefixo_na_faixa(chaves, dados, max_peso, max_volume, inicio, fim)
+        tamanho, valor_prefixo = resultado
+        avaliadas.append((valor_prefixo, lam, tamanho, fim))
+        # Multiplicadores vizinhos produzem cargas de tamanhos parecidos
+        inicio, fim = int(0.9 * tamanho), int(min(num_conteineres, 1.1 * tamanho + 64))
+
+    avaliadas.sort(key=lambda avaliada: -avaliada[0])
+    melhor_selecao = None
+    melhor_valor = -1
+    for _, lam, _, fim in avaliadas[:max(1, num_preenchimentos)]:
+        chaves = razoes(lam)
+        ordem = _ordem_parcial(chaves, fim)
+        if not preencher:
+            # O prefixo é recalculado na ordem devolvida, que pode desempatar razões iguais
+            # de outra forma que a ordem da faixa usada na varredura
+            selecao = ordem[:int(_tamanho_prefixo(pesos[ordem], volumes[ordem], max_peso, max_volume))]
+        else:
+            selecao, peso_residual, volume_residual = _preencher(ordem, pesos, volumes, max_peso, max_volume)
+            if len(ordem) < num_conteineres:
+                # Os contêineres fora da ordem parcial vêm depois dela; só os que cabem
+                # na capacidade residual ainda podem ser carregados
+                fora = np.ones(num_conteineres, dtype=bool)
+                fora[ordem] = False
+                fora &= (pesos <= peso_residual) & (volumes <= volume_residual)
+                restantes = np.flatnonzero(fora)
+                restantes = restantes[np.argsort(chaves[restantes])]
+                complemento, _, _ = _preencher(restantes, pesos, volumes, peso_residual, volume_residual)
+                selecao = np.concatenate([selecao, complemento])
+        valor = valores[selecao].sum()
+        if valor > melhor_valor:
+            melhor_selecao = selecao
+            melhor_valor = valor
+
+    totais = dados[melhor_selecao].sum(axis=0)
+    if np.array_equal(dados, np.trunc(dados)):
+        # Dados inteiros: devolve os totais como inteiros, assim como a Gulosa original
+        totais = totais.astype(np.int64)
+    return (melhor_selecao.tolist(), *totais.tolist())
+
+def heuristica_gulosa_multinavio(dados_conteineres, capacidades):
+    """
+    Implementa a heurística gulosa para o carregamento de vários navios (ou porões).
+
+    Os contêineres são ordenados pela razão entre o valor e o consumo da capacidade total
+    da frota, com peso e volume normalizados pela soma das capacidades de todos os navios.
+    Nessa ordem, cada contêiner é colocado no navio com maior folga relativa que ainda
+    o comporta; se nenhum navio o comporta, ele não é carregado.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        capacidades: Lista de tuplas (max_peso, max_volume), uma por navio.
+
+    Returns:
+        Uma tupla contendo:
+            - Uma lista com o navio de cada contêiner (1 a N, ou 0 se não carregado),
+              no mesmo formato do genoma do AG multinavio.
+            - Uma lista com o peso total carregado em cada navio.
+            - Uma lista com o volume total carregado em cada navio.
+            - O valor total dos contêineres carregados.
+    """
+    dados = np.asarray(dados_conteineres, dtype=float).reshape(-1, 3)
+    capacidades = np.asarray(capacidades, dtype=float).reshape(-1, 2)
+    pesos, volumes, valores = dados[:, 0], dados[:, 1], dados[:, 2]
+    total_peso, total_volume = capacidades.sum(axis=0)
+
+    consumo = pesos / total_peso + volumes / total_volume
+    ordem = np.argsort(-valores / np.maximum(consumo, 1e-12), kind="stable")
+
+    atribuicao = [0] * len(dados)
+    peso_residual = capacidades[:, 0].copy()
+    volume_residual = capacidades[:, 1].copy()
+    valor_total = 0
+    for i in ordem:
+        comporta = (peso_residual >= pesos[i]) & (volume_residual >= volumes[i])
+        if not comporta.any():
+            continue
+        folga = peso_residual / capacidades[:, 0] + volume_residual / capacidades[:, 1]
+        navio = int(np.argmax(np.where(comporta, folga, -np.inf)))
+        atribuicao[i] = navio + 1
+        peso_residual[navio] -= pesos[i]
+        volume_residual[navio] -= volumes[i]
+        valor_total += dados_conteineres[i][2]
+
+    pesos_navios = [0] * len(capacidades)
+    volumes_navios = [0] * len(capacidades)
+    for i, navio in enumerate(atribuicao):
+        if navio:
+            pesos_navios[navio - 1] += dados_conteineres[i][0]
+            volumes_navios[navio - 1] += dados_conteineres[i][1]
+    return atribuicao, pesos_navios, volumes_navios, valor_total
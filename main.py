@@ -2,9 +2,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import csv
 from utils import gerar_dados_conteineres, gerar_dados_conteineres_estaticos, decodificar_solucao, executar_ag_multiplas_vezes, executar_comparacao
+from utils import executar_comparacao_multinavio, executar_pareto, executar_ag_adaptativo
 from algoritmo_genetico import selecao_torneio, selecao_roleta, selecao_ranking
-from visualizacoes import plot_comparison, plot_improvements
+from cache_resultados import PASTA_CACHE
+from ajuste_parametros import corrida_parametros
+from visualizacoes import plot_comparison, plot_improvements, plot_pareto
 import argparse
 
 # Configurações globais
@@ -13,7 +17,9 @@ sns.set_palette("deep")
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 12
 
-def experimento_completo(max_peso, max_volume, num_conteineres, dados_conteineres, params_ag, num_execucoes_consistencia=10):
+def experimento_completo(max_peso, max_volume, num_conteineres, dados_conteineres, params_ag, num_execucoes_consistencia=10,
+                         preprocessar=False, semear=False, semente=None, pasta_cache=None,
+                         largura_ic=None, tempo_consistencia=None):
     """
     Executa um experimento completo para o problema de carregamento de contêineres,
     comparando diferentes algoritmos e analisando a consistência do Algoritmo Genético (AG).
@@ -26,6 +32,22 @@ def experimento_completo(max_peso, max_volume, num_conteineres, dados_conteinere
         params_ag (dict): Dicionário contendo os parâmetros para o algoritmo genético.
         num_execucoes_consistencia (int, optional): Número de execuções do AG para análise de consistência.
                                                     Defaults to 10.
+        preprocessar (bool, optional): Reduz a instância antes da Busca Local e do AG.
+                                       Defaults to False.
+        semear (bool, optional): Inclui a solução da Gulosa Surrogada na população inicial do AG.
+                                 Defaults to False.
+        semente (int, optional): Semente aleatória aplicada antes de cada algoritmo. Defaults to None.
+        pasta_cache (str, optional): Pasta do cache de resultados; None desativa o cache.
+                                     O cache só é usado quando há semente. Defaults to None.
+        largura_ic (float, optional): Se informada, a análise de consistência repete o AG até que o
+                                      intervalo de confiança de 95% da média do valor do frete tenha
+                                      largura menor que este valor, em vez de um número fixo de execuções.
+                                      Defaults to None.
+        tempo_consistencia (float, optional): Tempo máximo, em segundos, da análise de consistência
+                                              adaptativa. Defaults to None.
+
+    Na análise adaptativa, os dados de cada execução do AG são gravados em
+    'resultados/consistencia_ag.csv' assim que ela termina.
     """
     # Cria a pasta 'resultados' se ela não existir
     if not os.path.exists('resultados'):
@@ -33,11 +55,33 @@ def experimento_completo(max_peso, max_volume, num_conteineres, dados_conteinere
 
     print("Executando comparação entre todos os algoritmos...")
     # Executa a comparação entre os algoritmos e armazena os resultados
-    resultados = executar_comparacao(dados_conteineres, max_peso, max_volume, params_ag)
+    resultados = executar_comparacao(dados_conteineres, max_peso, max_volume, params_ag, preprocessar, semear,
+                                     semente, pasta_cache)
 
     print("Executando múltiplas execuções do AG para análise de consistência...")
-    # Executa o AG múltiplas vezes para análise de consistência
-    resultados_ag_multiplos = executar_ag_multiplas_vezes(dados_conteineres, max_peso, max_volume, params_ag, num_execucoes_consistencia)
+    if largura_ic is not None:
+        # Repete o AG até que a média esteja estimada com a precisão desejada,
+        # gravando os dados de cada execução assim que ela termina
+        resultados_ag_multiplos = []
+        campos = ['execucao', 'valor_total', 'peso_total', 'volume_total', 'num_conteineres',
+                  'tempo_execucao', 'geracoes', 'referencia', 'media', 'largura_intervalo']
+        with open(os.path.join('resultados', 'consistencia_ag.csv'), 'w', newline='', encoding='utf-8') as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=campos, extrasaction='ignore')
+            escritor.writeheader()
+            for execucao in executar_ag_adaptativo(dados_conteineres, max_peso, max_volume, params_ag, largura_ic,
+                                                   tempo_consistencia, preprocessar=preprocessar, semear=semear,
+                                                   semente=semente):
+                resultados_ag_multiplos.append(execucao['valor_total'])
+                escritor.writerow(dict(execucao, num_conteineres=len(execucao['conteineres'])))
+                arquivo.flush()
+                print(f"Execução {execucao['execucao']}: ${execucao['valor_total']:.2f} em "
+                      f"{execucao['tempo_execucao']:.2f} s ({execucao['geracoes']} gerações) | "
+                      f"média ${execucao['media']:.2f}, intervalo de confiança ${execucao['largura_intervalo']:.2f}")
+    else:
+        # Executa o AG múltiplas vezes para análise de consistência
+        resultados_ag_multiplos = executar_ag_multiplas_vezes(dados_conteineres, max_peso, max_volume, params_ag,
+                                                              num_execucoes_consistencia, preprocessar, semear,
+                                                              semente, pasta_cache)
 
     # Imprime os resultados da comparação entre os algoritmos
     print("\nResultados da comparação:")
@@ -47,9 +91,13 @@ def experimento_completo(max_peso, max_volume, num_conteineres, dados_conteinere
         print(f"Peso total: {resultado['peso_total']} toneladas")
         print(f"Volume total: {resultado['volume_total']} metros cúbicos")
         print(f"Número de contêineres carregados: {len(resultado['conteineres'])}")
+        print(f"Tempo de execução: {resultado['tempo_execucao']:.4f} segundos")
+        if resultado['referencia']:
+            print("Solução de referência da Gulosa Surrogada: a busca no núcleo reduzido não a superou.")
 
     # Imprime os resultados da análise de consistência do AG
     print("\nAnálise de consistência do AG:")
+    print(f"Número de execuções: {len(resultados_ag_multiplos)}")
     print(f"Média do valor total: ${np.mean(resultados_ag_multiplos):.2f}")
     print(f"Desvio padrão: ${np.std(resultados_ag_multiplos):.2f}")
     print(f"Valor mínimo: ${min(resultados_ag_multiplos):.2f}")
@@ -65,7 +113,9 @@ def experimento_completo(max_peso, max_volume, num_conteineres, dados_conteinere
 
     # Comparação de Valor Total do Frete
     valores_frete = [resultado['valor_total'] for resultado in resultados.values()]
-    labels = list(resultados.keys())
+    # Resultados que repetem a referência da redução não são creditados ao algoritmo
+    labels = [f"{algoritmo} (referência)" if resultado['referencia'] else algoritmo
+              for algoritmo, resultado in resultados.items()]
     plot_comparison(valores_frete, labels,
                 'Comparação de Valor Total do Frete', 'Valor do Frete ($)',
                 os.path.join(pasta_resultados, 'valor_frete_comparacao.png'))
@@ -109,11 +159,108 @@ def experimento_completo(max_peso, max_volume, num_conteineres, dados_conteinere
 
     print("Experimento concluído. Os resultados e visualizações foram salvos na pasta 'resultados/'.")
 
+def experimento_multinavio(capacidades, dados_conteineres, params_ag, semear=False, semente=None):
+    """
+    Executa o experimento de carregamento de vários navios (ou porões), comparando a
+    Heurística Gulosa multinavio e o AG multinavio.
+
+    Args:
+        capacidades (list): Lista de tuplas (max_peso, max_volume), uma por navio.
+        dados_conteineres (list): Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        params_ag (dict): Dicionário contendo os parâmetros para o algoritmo genético.
+        semear (bool, optional): Inclui a solução da Gulosa na população inicial do AG.
+                                 Defaults to False.
+        semente (int, optional): Semente aleatória aplicada antes do AG. Defaults to None.
+    """
+    pasta_resultados = 'resultados'
+    if not os.path.exists(pasta_resultados):
+        os.makedirs(pasta_resultados)
+
+    print(f"Executando comparação entre os algoritmos para {len(capacidades)} navios...")
+    resultados = executar_comparacao_multinavio(dados_conteineres, capacidades, params_ag, semear, semente)
+
+    print("\nResultados da comparação:")
+    for algoritmo, resultado in resultados.items():
+        print(f"\n{algoritmo}:")
+        print(f"Valor total do frete: ${resultado['valor_total']:.2f}")
+        print(f"Número de contêineres carregados: {len(resultado['conteineres'])}")
+        for navio, (carregados, peso, volume, valor) in enumerate(resultado['navios'], start=1):
+            max_peso, max_volume = capacidades[navio - 1]
+            print(f"  Navio {navio}: {len(carregados)} contêineres, ${valor:.2f}, "
+                  f"{peso}/{max_peso} toneladas, {volume}/{max_volume} metros cúbicos")
+
+    print("\nGerando visualizações...")
+    plot_comparison([resultado['valor_total'] for resultado in resultados.values()], list(resultados.keys()),
+                    'Comparação de Valor Total do Frete (Multinavio)', 'Valor do Frete ($)',
+                    os.path.join(pasta_resultados, 'valor_frete_multinavio.png'))
+
+    print("Experimento concluído. Os resultados e visualizações foram salvos na pasta 'resultados/'.")
+
+def experimento_pareto(max_peso, max_volume, dados_conteineres, params_ag, semente=None):
+    """
+    Executa o AG multiobjetivo (NSGA-II) e apresenta a frente de Pareto entre valor do frete,
+    utilização da capacidade e equilíbrio entre peso e volume.
+
+    Args:
+        max_peso (int): Peso máximo que o navio pode carregar (em toneladas).
+        max_volume (int): Volume máximo que o navio pode carregar (em metros cúbicos).
+        dados_conteineres (list): Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        params_ag (dict): Dicionário contendo os parâmetros para o algoritmo genético. A função de
+                          seleção e o limite sem melhora são ignorados, pois o NSGA-II usa o
+                          torneio por aglomeração e executa todas as gerações.
+        semente (int, optional): Semente aleatória aplicada antes do AG. Defaults to None.
+    """
+    pasta_resultados = 'resultados'
+    if not os.path.exists(pasta_resultados):
+        os.makedirs(pasta_resultados)
+
+    print("Executando o AG multiobjetivo...")
+    # Mantém apenas os parâmetros aceitos pelo NSGA-II (ex: descarta funcao_selecao e limite_sem_melhora)
+    parametros_pareto = ('tamanho_populacao', 'num_geracoes', 'taxa_crossover', 'taxa_mutacao')
+    params_pareto = {chave: valor for chave, valor in params_ag.items() if chave in parametros_pareto}
+    frente = executar_pareto(dados_conteineres, max_peso, max_volume, params_pareto, semente)
+
+    print(f"\nFrente de Pareto ({len(frente)} soluções):")
+    for resultado in frente:
+        print(f"Valor: ${resultado['valor_total']:.2f} | "
+              f"Peso: {resultado['peso_total']} t | Volume: {resultado['volume_total']} m³ | "
+              f"Utilização: {resultado['utilizacao'] * 100:.1f}% | "
+              f"Desequilíbrio: {resultado['desequilibrio'] * 100:.1f}%")
+
+    print("\nGerando visualizações...")
+    plot_pareto([resultado['valor_total'] for resultado in frente],
+                [resultado['utilizacao'] for resultado in frente],
+                [resultado['desequilibrio'] for resultado in frente],
+                'Frente de Pareto: Valor x Utilização x Equilíbrio',
+                os.path.join(pasta_resultados, 'frente_pareto.png'))
+
+    print("Experimento concluído. Os resultados e visualizações foram salvos na pasta 'resultados/'.")
+
 parser = argparse.ArgumentParser(description='Experimento de carregamento de contêineres.')
 parser.add_argument('--dados', choices=['estaticos', 'aleatorios'], default='aleatorios',
                     help='Tipo de dados a serem usados (estaticos ou aleatorios)')
 parser.add_argument('--selecao', choices=['torneio', 'roleta', 'ranking'], default='torneio',
                     help='Função de seleção a ser utilizada (torneio, roleta ou ranking)')
+parser.add_argument('--preprocessar', action='store_true',
+                    help='Reduz a instância antes da busca, fixando contêineres certos e agrupando idênticos')
+parser.add_argument('--semear', action='store_true',
+                    help='Inclui a solução da Gulosa Surrogada na população inicial do AG')
+parser.add_argument('--navios', type=int, default=1,
+                    help='Número de navios (ou porões) que dividem igualmente o peso e o volume máximos')
+parser.add_argument('--pareto', action='store_true',
+                    help='Executa o AG multiobjetivo (NSGA-II) e apresenta a frente de Pareto')
+parser.add_argument('--ajustar', action='store_true',
+                    help='Ajusta os parâmetros do AG por corrida entre configurações antes do experimento')
+parser.add_argument('--largura-ic', type=float, default=None,
+                    help='Repete o AG na análise de consistência até que o intervalo de confiança de 95%% '
+                         'da média do valor do frete tenha largura menor que este valor')
+parser.add_argument('--tempo-consistencia', type=float, default=None,
+                    help='Tempo máximo, em segundos, da análise de consistência com --largura-ic')
+parser.add_argument('--semente', type=int, default=None,
+                    help='Semente aleatória aplicada antes de cada algoritmo, para resultados reprodutíveis')
+parser.add_argument('--sem-cache', action='store_true',
+                    help='Recalcula todos os algoritmos em vez de reutilizar resultados do cache '
+                         '(o cache só é usado com --semente)')
 
 if __name__ == "__main__":
     try:
@@ -122,6 +269,21 @@ if __name__ == "__main__":
         NUM_CONTEINERES = 50
 
         args = parser.parse_args()
+        if args.tempo_consistencia is not None and args.largura_ic is None:
+            parser.error('--tempo-consistencia só pode ser usado junto com --largura-ic')
+        # Os modos multinavio e Pareto não têm pré-processamento, análise de consistência nem cache
+        if args.pareto or args.navios > 1:
+            modo = '--pareto' if args.pareto else '--navios'
+            opcoes_invalidas = [opcao for opcao, usada in (
+                ('--preprocessar', args.preprocessar),
+                ('--largura-ic', args.largura_ic is not None),
+                ('--tempo-consistencia', args.tempo_consistencia is not None),
+                ('--sem-cache', args.sem_cache),
+                ('--semear', args.pareto and args.semear),
+                ('--navios', args.pareto and args.navios > 1),
+            ) if usada]
+            if opcoes_invalidas:
+                parser.error(f"opções incompatíveis com {modo}: {', '.join(opcoes_invalidas)}")
 
         # Verifica como os dados serão gerados
         if args.dados == 'estaticos':
@@ -144,7 +306,27 @@ if __name__ == "__main__":
             "funcao_selecao": funcao_selecao # Adiciona a função de seleção aqui
         }
 
-        experimento_completo(MAX_PESO, MAX_VOLUME, NUM_CONTEINERES, dados_conteineres, params_ag)
+        # Ajuste dos parâmetros do AG por corrida, usando a instância atual e outras do mesmo tamanho
+        if args.ajustar:
+            print("Ajustando os parâmetros do AG por corrida entre configurações...")
+            instancias = [(dados_conteineres, MAX_PESO, MAX_VOLUME)]
+            instancias += [(gerar_dados_conteineres(NUM_CONTEINERES), MAX_PESO, MAX_VOLUME) for _ in range(4)]
+            params_ag, _ = corrida_parametros(instancias, semente=args.semente or 0)
+            print("Melhor configuração encontrada:")
+            for parametro, valor in params_ag.items():
+                print(f"  {parametro}: {getattr(valor, '__name__', valor)}")
+
+        if args.pareto:
+            experimento_pareto(MAX_PESO, MAX_VOLUME, dados_conteineres, params_ag, semente=args.semente)
+        elif args.navios > 1:
+            capacidades = [(MAX_PESO // args.navios, MAX_VOLUME // args.navios)] * args.navios
+            experimento_multinavio(capacidades, dados_conteineres, params_ag, semear=args.semear,
+                                   semente=args.semente)
+        else:
+            experimento_completo(MAX_PESO, MAX_VOLUME, NUM_CONTEINERES, dados_conteineres, params_ag,
+                                 preprocessar=args.preprocessar, semear=args.semear, semente=args.semente,
+                                 pasta_cache=None if args.sem_cache else PASTA_CACHE,
+                                 largura_ic=args.largura_ic, tempo_consistencia=args.tempo_consistencia)
     except Exception as e:
         print(f"Ocorreu um erro: {e}")
         import traceback
@@ -0,0 +1,298 @@
+import numpy as np
+from heuristica_gulosa import heuristica_gulosa_surrogada
+
+MAX_NUCLEO_DOMINANCIA = 5000  # Acima disso a remoção de dominados é pulada
+
+def _relaxacao_surrogada(pesos, volumes, valores, max_peso, max_volume, lam):
+    """
+    Resolve pela regra de Dantzig a relaxação linear da mochila surrogada de um multiplicador.
+
+    O consumo de um contêiner é lambda * peso / max_peso + (1 - lambda) * volume / max_volume,
+    com capacidade 1.
+
+    Returns:
+        Uma tupla contendo:
+            - O valor da relaxação linear (limite superior do problema).
+            - O array de custos reduzidos de cada contêiner.
+    """
+    consumo = lam * pesos / max_peso + (1 - lam) * volumes / max_volume
+    consumo = np.maximum(consumo, 1e-12)
+    ordem = np.argsort(-valores / consumo, kind="stable")
+    consumo_acumulado = np.cumsum(consumo[ordem])
+
+    # Item crítico: o primeiro que não cabe integralmente na capacidade surrogada
+    critico = np.searchsorted(consumo_acumulado, 1.0, side="right")
+    if critico >= len(ordem):
+        preco = 0.0
+    else:
+        preco = valores[ordem[critico]] / consumo[ordem[critico]]
+
+    # Limite dual: preco * capacidade + soma dos custos reduzidos positivos.
+    # Com o preço do item crítico ele coincide com o valor da relaxação linear.
+    custos_reduzidos = valores - preco * consumo
+    return preco + np.maximum(custos_reduzidos, 0).sum(), custos_reduzidos
+
+def _limite_superior_surrogado(pesos, volumes, valores, max_peso, max_volume, num_multiplicadores=11,
+                               num_refinamentos=30):
+    """
+    Calcula o limite superior da relaxação linear do problema, agregando as restrições
+    de peso e volume em uma única restrição surrogada.
+
+    O limite de cada multiplicador lambda em [0, 1] vem de _relaxacao_surrogada. Os
+    multiplicadores são primeiro avaliados em uma grade e, em seguida, o melhor deles é
+    refinado por busca da seção áurea entre seus vizinhos na grade, o que é válido porque
+    o limite é quase-convexo em lambda. O refinamento importa: com a grade apenas, o
+    limite pode ficar milhares de unidades acima do ótimo da relaxação, e os custos
+    reduzidos deixam de fixar contêineres.
+
+    Args:
+        pesos: Array com o peso de cada contêiner.
+        volumes: Array com o volume de cada contêiner.
+        valores: Array com o valor de cada contêiner.
+        max_peso: Peso máximo disponível.
+        max_volume: Volume máximo disponível.
+        num_multiplicadores: Quantidade de multiplicadores da grade.
+        num_refinamentos: Quantidade de iterações da busca da seção áurea.
+
+    Returns:
+        Uma tupla contendo:
+            - O limite superior da relaxação linear.
+            - O array de custos reduzidos de cada contêiner no multiplicador escolhido.
+            - O multiplicador escolhido.
+    """
+    avaliados = {}
+
+    def avaliar(lam):
+        if lam not in avaliados:
+            avaliados[lam] = _relaxacao_surrogada(pesos, volumes, valores, max_peso, max_volume, lam)
+        return avaliados[lam][0]
+
+    grade = np.linspace(0, 1, num_multiplicadores).tolist()
+    melhor = min(range(len(grade)), key=lambda k: avaliar(grade[k]))
+
+    # Busca da seção áurea no intervalo entre os vizinhos do melhor ponto da grade
+    razao = (np.sqrt(5) - 1) / 2
+    a, b = grade[max(melhor - 1, 0)], grade[min(melhor + 1, len(grade) - 1)]
+    x1, x2 = b - razao * (b - a), a + razao * (b - a)
+    for _ in range(num_refinamentos):
+        if avaliar(x1) <= avaliar(x2):
+            b, x2 = x2, x1
+            x1 = b - razao * (b - a)
+        else:
+            a, x1 = x1, x2
+            x2 = a + razao * (b - a)
+
+    lam = min(avaliados, key=lambda lam: avaliados[lam][0])
+    limite, custos_reduzidos = avaliados[lam]
+    return limite, custos_reduzidos, lam
+
+def _remover_dominados(indices, pesos, volumes, valores, max_peso, max_volume):
+    """
+    Remove do núcleo os contêineres estritamente dominados que nunca precisam ser carregados.
+
+    Um contêiner j é dominado por i quando i não é mais pesado, não é mais volumoso e
+    não vale menos que j, sendo estritamente melhor em ao menos um critério. Se j e todos
+    os seus dominadores não couberem juntos no navio, qualquer carga com j deixa de fora
+    algum dominador, que pode substituir j sem perda. Nesse caso j é descartado.
+
+    As relações de dominância são calculadas em blocos de contêineres, como matrizes
+    bloco x núcleo, e as somas dos dominadores por produtos de matrizes. O custo ainda é
+    quadrático no tamanho do núcleo, por isso núcleos com mais de MAX_NUCLEO_DOMINANCIA
+    contêineres são devolvidos sem alteração. Pular a etapa é sempre seguro: ela apenas
+    descarta contêineres que não são necessários.
+
+    Args:
+        indices: Array com os índices (na instância original) dos contêineres do núcleo.
+        pesos: Array com o peso de cada contêiner da instância original.
+        volumes: Array com o volume de cada contêiner da instância original.
+        valores: Array com o valor de cada contêiner da instância original.
+        max_peso: Peso residual disponível para o núcleo.
+        max_volume: Volume residual disponível para o núcleo.
+
+    Returns:
+        Uma tupla contendo:
+            - O array de índices mantidos no núcleo.
+            - O array de índices descartados por dominância.
+    """
+    if len(indices) > MAX_NUCLEO_DOMINANCIA:
+        return indices, indices[:0]
+    p, v, c = pesos[indices], volumes[indices], valores[indices]
+    manter = np.ones(len(indices), dtype=bool)
+    tamanho_bloco = max(1, 4_000_000 // max(len(indices), 1))
+    for inicio in range(0, len(indices), tamanho_bloco):
+        j = slice(inicio, inicio + tamanho_bloco)
+        pj, vj, cj = p[j, None], v[j, None], c[j, None]
+        # Linha r: quais contêineres do núcleo dominam o contêiner inicio + r
+        dominadores = ((p <= pj) & (v <= vj) & (c >= cj) & ((p < pj) | (v < vj) | (c > cj))).astype(float)
+        manter[j] = (dominadores @ p + p[j] <= max_peso) & (dominadores @ v + v[j] <= max_volume)
+    return indices[manter], indices[~manter]
+
+def _agrupar_identicos(indices, dados_conteineres):
+    """
+    Agrupa contêineres idênticos em pseudo-contêineres de multiplicidade binária.
+
+    Um grupo de k contêineres iguais é representado por pseudo-contêineres com
+    multiplicidades 1, 2, 4, ..., resto, de forma que qualquer quantidade entre 0 e k
+    possa ser escolhida com um genoma binário de tamanho aproximadamente log2(k + 1).
+
+    Args:
+        indices: Array com os índices (na instância original) dos contêineres do núcleo.
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+
+    Returns:
+        Uma tupla contendo:
+            - Uma lista de tuplas (peso, volume, valor) dos pseudo-contêineres.
+            - Uma lista com, para cada pseudo-contêiner, os índices originais que ele representa.
+    """
+    grupos = {}
+    for i in indices:
+        grupos.setdefault(tuple(dados_conteineres[i]), []).append(int(i))
+
+    dados_nucleo = []
+    membros = []
+    for (peso, volume, valor), grupo in grupos.items():
+        inicio = 0
+        multiplicidade = 1
+        while inicio < len(grupo):
+            quantidade = min(multiplicidade, len(grupo) - inicio)
+            dados_nucleo.append((peso * quantidade, volume * quantidade, valor * quantidade))
+            membros.append(grupo[inicio:inicio + quantidade])
+            inicio += quantidade
+            multiplicidade *= 2
+    return dados_nucleo, membros
+
+def reduzir_instancia(dados_conteineres, max_peso, max_volume):
+    """
+    Reduz a instância do problema antes da busca, deixando para o AG e a Busca Local
+    apenas o núcleo de contêineres incertos.
+
+    A redução é feita em quatro etapas:
+        1. Contêineres que sozinhos excedem o peso ou o volume máximo são descartados.
+        2. Com o limite superior da relaxação linear surrogada e o valor da Gulosa Surrogada
+           como limite inferior, os custos reduzidos fixam contêineres: se forçar a decisão
+           contrária à da relaxação derruba o limite abaixo do valor da Gulosa Surrogada,
+           a decisão da relaxação é fixada. Os dois limites usam o multiplicador ótimo
+           da relaxação, já que a folga entre eles decide quantos contêineres são fixados.
+        3. Contêineres dominados que nunca precisam ser carregados são descartados
+           (apenas em núcleos de até MAX_NUCLEO_DOMINANCIA contêineres).
+        4. Contêineres idênticos são agrupados em pseudo-contêineres.
+
+    As fixações preservam toda solução melhor que a da Gulosa Surrogada, que fica
+    registrada como referência. Por isso a solução encontrada no núcleo deve sempre ser
+    comparada com a referência (ver melhor_que_referencia). Se os contêineres fixados
+    não couberem juntos no navio, nenhuma solução supera a Gulosa Surrogada e ela
+    própria é devolvida como carga fixa.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        max_peso: Peso máximo que o navio pode carregar.
+        max_volume: Volume máximo que o navio pode carregar.
+
+    Returns:
+        Um dicionário com as seguintes chaves:
+            - 'dados': Lista de tuplas (peso, volume, valor) dos pseudo-contêineres do núcleo.
+            - 'membros': Para cada pseudo-contêiner, a lista de índices originais que ele representa.
+            - 'fixos': Lista de índices originais fixados como carregados.
+            - 'max_peso': Peso residual disponível para o núcleo.
+            - 'max_volume': Volume residual disponível para o núcleo.
+            - 'referencia': Lista de índices da solução da Gulosa Surrogada.
+            - 'limite_superior': Limite superior da relaxação linear para a instância original.
+    """
+    pesos = np.array([d[0] for d in dados_conteineres], dtype=float)
+    volumes = np.array([d[1] for d in dados_conteineres], dtype=float)
+    valores = np.array([d[2] for d in dados_conteineres], dtype=float)
+
+    cabem = (pesos <= max_peso) & (volumes <= max_volume)
+    candidatos = np.flatnonzero(cabem)
+
+    limite, custos, lam = _limite_superior_surrogado(pesos[candidatos], volumes[candidatos],
+                                                     valores[candidatos], max_peso, max_volume)
+    # O multiplicador ótimo da relaxação costuma dar a melhor ordem para a Gulosa Surrogada
+    multiplicadores = np.append(np.linspace(0, 1, 33), lam)
+    referencia, _, _, valor_referencia = heuristica_gulosa_surrogada(dados_conteineres, max_peso, max_volume,
+                                                                     multiplicadores=multiplicadores)
+
+    # Forçar a decisão contrária à da relaxação reduz o limite em |custo reduzido|
+    decidido = limite - np.abs(custos) <= valor_referencia
+    fixos = candidatos[decidido & (custos > 0)]
+    incertos = candidatos[~decidido]
+
+    peso_residual = max_peso - pesos[fixos].sum()
+    volume_residual = max_volume - volumes[fixos].sum()
+    if peso_residual < 0 or volume_residual < 0:
+        # Nenhuma carga supera a da Gulosa Surrogada: ela é ótima e o núcleo fica vazio
+        fixos = np.array(sorted(referencia), dtype=int)
+        incertos = np.array([], dtype=int)
+        peso_residual = max_peso - pesos[fixos].sum()
+        volume_residual = max_volume - volumes[fixos].sum()
+
+    # Contêineres do núcleo que não cabem na capacidade residual também saem
+    incertos = incertos[(pesos[incertos] <= peso_residual) & (volumes[incertos] <= volume_residual)]
+    incertos, _ = _remover_dominados(incertos, pesos, volumes, valores, peso_residual, volume_residual)
+
+    dados_nucleo, membros = _agrupar_identicos(incertos, dados_conteineres)
+
+    return {
+        "dados": dados_nucleo,
+        "membros": membros,
+        "fixos": [int(i) for i in fixos],
+        "max_peso": max_peso - sum(dados_conteineres[i][0] for i in fixos),
+        "max_volume": max_volume - sum(dados_conteineres[i][1] for i in fixos),
+        "referencia": referencia,
+        "limite_superior": float(limite),
+    }
+
+def expandir_solucao(selecionados_nucleo, reducao):
+    """
+    Mapeia uma solução do núcleo reduzido de volta para os índices da instância original.
+
+    Args:
+        selecionados_nucleo: Lista de índices dos pseudo-contêineres selecionados no núcleo.
+        reducao: Dicionário retornado por reduzir_instancia.
+
+    Returns:
+        Uma lista ordenada com os índices originais dos contêineres carregados.
+    """
+    selecionados = list(reducao["fixos"])
+    for i in selecionados_nucleo:
+        selecionados.extend(reducao["membros"][i])
+    return sorted(selecionados)
+
+def expandir_genoma(genoma_nucleo, reducao, tamanho_genoma):
+    """
+    Converte o genoma do núcleo reduzido em um genoma binário da instância original.
+
+    Args:
+        genoma_nucleo: Genoma binário sobre os pseudo-contêineres do núcleo.
+        reducao: Dicionário retornado por reduzir_instancia.
+        tamanho_genoma: Número de contêineres da instância original.
+
+    Returns:
+        Uma lista de bits com um gene por contêiner da instância original.
+    """
+    genoma = [0] * tamanho_genoma
+    selecionados_nucleo = [i for i, bit in enumerate(genoma_nucleo) if bit == 1]
+    for i in expandir_solucao(selecionados_nucleo, reducao):
+        genoma[i] = 1
+    return genoma
+
+def melhor_que_referencia(selecionados, reducao, dados_conteineres):
+    """
+    Escolhe entre uma solução expandida e a solução de referência da redução.
+
+    Args:
+        selecionados: Lista de índices originais dos contêineres carregados.
+        reducao: Dicionário retornado por reduzir_instancia.
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+
+    Returns:
+        Uma tupla contendo:
+            - A lista de índices originais da solução de maior valor total.
+            - True se a solução devolvida é a de referência, ou seja, se a busca no núcleo
+              não a superou.
+    """
+    valor = sum(dados_conteineres[i][2] for i in selecionados)
+    valor_referencia = sum(dados_conteineres[i][2] for i in reducao["referencia"])
+    if valor_referencia > valor:
+        return sorted(reducao["referencia"]), True
+    return selecionados, False
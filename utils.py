@@ -1,7 +1,14 @@
+import math
 import random
-from algoritmo_genetico import algoritmo_genetico
-from heuristica_gulosa import heuristica_gulosa
+import time
+from statistics import NormalDist
+from algoritmo_genetico import Individuo, algoritmo_genetico
+from algoritmo_genetico_multinavio import algoritmo_genetico_multinavio
+from algoritmo_genetico_pareto import algoritmo_genetico_pareto
+from heuristica_gulosa import heuristica_gulosa, heuristica_gulosa_surrogada, heuristica_gulosa_multinavio
 from busca_local import busca_local
+from preprocessamento import reduzir_instancia, expandir_solucao, melhor_que_referencia
+from cache_resultados import chave_cache, executar_com_cache
 
 def gerar_dados_conteineres(num_conteineres):
     """
@@ -50,7 +57,9 @@ def decodificar_solucao(melhor_individuo, dados_conteineres):
 
     A função percorre o genoma do indivíduo e, para cada bit 1, adiciona o contêiner
     correspondente à lista de contêineres carregados. Também calcula o peso total,
-    volume total e valor total dos contêineres carregados.
+    volume total e valor total dos contêineres carregados. Genomas do AG multinavio
+    também são aceitos: qualquer gene diferente de 0 conta como carregado, e a divisão
+    por navio é obtida com decodificar_solucao_multinavio.
 
     Args:
         melhor_individuo: Objeto Individuo representando a melhor solução encontrada.
@@ -69,7 +78,7 @@ def decodificar_solucao(melhor_individuo, dados_conteineres):
     volume_total = 0
     valor_total = 0
     for i, bit in enumerate(melhor_individuo.genoma):
-        if bit == 1:
+        if bit != 0:
             peso, volume, valor = dados_conteineres[i]
             conteineres_carregados.append((i, peso, volume, valor))
             peso_total += peso
@@ -77,21 +86,262 @@ def decodificar_solucao(melhor_individuo, dados_conteineres):
             valor_total += valor
     return conteineres_carregados, peso_total, volume_total, valor_total
 
-def executar_ag_multiplas_vezes(dados_conteineres, max_peso, max_volume, params_ag, num_execucoes=10):
-    resultados = []
-    for _ in range(num_execucoes):
-        melhor_solucao = algoritmo_genetico(dados_conteineres, max_peso, max_volume, False, **params_ag)
-        resultado = decodificar_solucao(melhor_solucao, dados_conteineres)
-        resultados.append(resultado[3])  # Armazena apenas o valor total
-    return resultados
+def decodificar_solucao_multinavio(melhor_individuo, dados_conteineres, num_navios):
+    """
+    Decodifica, navio a navio, a solução encontrada pelo AG multinavio.
+
+    Args:
+        melhor_individuo: Objeto Individuo cujo genoma indica o navio de cada contêiner (0 = não carregado).
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        num_navios: Número de navios.
+
+    Returns:
+        Uma lista com uma tupla por navio, no mesmo formato de decodificar_solucao:
+            (contêineres carregados, peso total, volume total, valor total).
+    """
+    navios = [([], 0, 0, 0) for _ in range(num_navios)]
+    for i, navio in enumerate(melhor_individuo.genoma):
+        if navio != 0:
+            peso, volume, valor = dados_conteineres[i]
+            carregados, peso_total, volume_total, valor_total = navios[navio - 1]
+            carregados.append((i, peso, volume, valor))
+            navios[navio - 1] = (carregados, peso_total + peso, volume_total + volume, valor_total + valor)
+    return navios
+
+def resumir_carga(conteineres_selecionados, dados_conteineres):
+    """
+    Calcula os totais de uma carga a partir dos índices dos contêineres selecionados.
+
+    Args:
+        conteineres_selecionados: Lista de índices dos contêineres carregados.
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+
+    Returns:
+        Uma tupla no mesmo formato da Heurística Gulosa e da Busca Local:
+            (índices dos contêineres, peso total, volume total, valor total).
+    """
+    peso_total = sum(dados_conteineres[i][0] for i in conteineres_selecionados)
+    volume_total = sum(dados_conteineres[i][1] for i in conteineres_selecionados)
+    valor_total = sum(dados_conteineres[i][2] for i in conteineres_selecionados)
+    return list(conteineres_selecionados), peso_total, volume_total, valor_total
+
+def genoma_guloso(dados_conteineres, max_peso, max_volume):
+    """
+    Gera o genoma binário da solução da Gulosa Surrogada, para uso como semente do AG.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        max_peso: Peso máximo que o navio pode carregar.
+        max_volume: Volume máximo que o navio pode carregar.
+
+    Returns:
+        Uma lista de bits com um gene por contêiner.
+    """
+    genoma = [0] * len(dados_conteineres)
+    for i in heuristica_gulosa_surrogada(dados_conteineres, max_peso, max_volume)[0]:
+        genoma[i] = 1
+    return genoma
+
+def busca_local_preprocessada(dados_conteineres, reducao, **kwargs):
+    """
+    Executa a Busca Local apenas sobre o núcleo de uma instância reduzida.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        reducao: Dicionário retornado por reduzir_instancia.
+        **kwargs: Parâmetros adicionais repassados para busca_local.
+
+    Returns:
+        Uma tupla no mesmo formato de busca_local, com índices da instância original, seguida
+        de um booleano que indica se a solução é a de referência da redução (a Gulosa Surrogada),
+        devolvida porque a Busca Local no núcleo não a superou.
+    """
+    nucleo = reducao["dados"]
+    if len(nucleo) < 2:
+        # Com no máximo um contêiner incerto a Gulosa já é ótima
+        selecionados_nucleo = heuristica_gulosa(nucleo, reducao["max_peso"], reducao["max_volume"])[0]
+    else:
+        selecionados_nucleo = busca_local(nucleo, reducao["max_peso"], reducao["max_volume"], **kwargs)[0]
+    selecionados, usou_referencia = melhor_que_referencia(expandir_solucao(selecionados_nucleo, reducao), reducao,
+                                                          dados_conteineres)
+    return resumir_carga(selecionados, dados_conteineres) + (usou_referencia,)
+
+def algoritmo_genetico_preprocessado(dados_conteineres, reducao, visualizar, semear=False, **params_ag):
+    """
+    Executa o algoritmo genético apenas sobre o núcleo de uma instância reduzida.
+
+    O genoma evolui somente sobre os pseudo-contêineres incertos. O melhor indivíduo
+    é convertido de volta para um genoma com um gene por contêiner da instância original,
+    de modo que possa ser usado diretamente com decodificar_solucao.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        reducao: Dicionário retornado por reduzir_instancia.
+        visualizar: Booleano que indica se a visualização deve ser ativada.
+        semear: Se True, a solução da Gulosa Surrogada sobre o núcleo entra na população inicial.
+        **params_ag: Parâmetros repassados para algoritmo_genetico.
+
+    Returns:
+        Objeto Individuo com o genoma sobre a instância original. O atributo referencia é True
+        quando o genoma é o da solução de referência da redução, que o AG no núcleo não superou.
+    """
+    nucleo = reducao["dados"]
+    geracoes = 0
+    if len(nucleo) < 2:
+        # O crossover de dois pontos exige ao menos dois genes
+        selecionados_nucleo = heuristica_gulosa(nucleo, reducao["max_peso"], reducao["max_volume"])[0]
+    else:
+        if semear:
+            params_ag = dict(params_ag, sementes=[genoma_guloso(nucleo, reducao["max_peso"], reducao["max_volume"])])
+        melhor_nucleo = algoritmo_genetico(nucleo, reducao["max_peso"], reducao["max_volume"], visualizar, **params_ag)
+        selecionados_nucleo = [i for i, bit in enumerate(melhor_nucleo.genoma) if bit == 1]
+        geracoes = melhor_nucleo.geracoes
+    selecionados, usou_referencia = melhor_que_referencia(expandir_solucao(selecionados_nucleo, reducao), reducao,
+                                                          dados_conteineres)
+
+    genoma = [0] * len(dados_conteineres)
+    for i in selecionados:
+        genoma[i] = 1
+    melhor = Individuo(genoma)
+    melhor.fitness = sum(dados_conteineres[i][2] for i in selecionados)
+    melhor.geracoes = geracoes
+    melhor.referencia = usou_referencia
+    return melhor
+
+def executar_ag_multiplas_vezes(dados_conteineres, max_peso, max_volume, params_ag, num_execucoes=10, preprocessar=False,
+                                semear=False, semente=None, pasta_cache=None):
+    def executar():
+        if semente is not None:
+            random.seed(semente)
+        resultados = []
+        parametros = params_ag
+        reducao = reduzir_instancia(dados_conteineres, max_peso, max_volume) if preprocessar else None
+        if semear and reducao is None:
+            parametros = dict(params_ag, sementes=[genoma_guloso(dados_conteineres, max_peso, max_volume)])
+        for _ in range(num_execucoes):
+            if reducao is not None:
+                melhor_solucao = algoritmo_genetico_preprocessado(dados_conteineres, reducao, False, semear, **parametros)
+            else:
+                melhor_solucao = algoritmo_genetico(dados_conteineres, max_peso, max_volume, False, **parametros)
+            resultado = decodificar_solucao(melhor_solucao, dados_conteineres)
+            resultados.append(resultado[3])  # Armazena apenas o valor total
+        return resultados
+
+    parametros_cache = dict(params_ag, num_execucoes=num_execucoes, preprocessar=preprocessar, semear=semear)
+    chave = chave_cache(dados_conteineres, (max_peso, max_volume), "AG (consistência)", parametros_cache, semente)
+    # Sem semente as execuções são aleatórias e não podem ser reaproveitadas
+    return executar_com_cache(pasta_cache if semente is not None else None, chave, executar)
+
+def _quantil_t(probabilidade, graus):
+    """
+    Aproxima o quantil da distribuição t de Student pela expansão de Cornish-Fisher
+    a partir do quantil da normal (erro abaixo de 1% a partir de 3 graus de liberdade).
+    """
+    z = NormalDist().inv_cdf(probabilidade)
+    return (z + (z ** 3 + z) / (4 * graus)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * graus ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * graus ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / (92160 * graus ** 4))
 
-def executar_comparacao(dados_conteineres, max_peso, max_volume, params_ag):
+def executar_ag_adaptativo(dados_conteineres, max_peso, max_volume, params_ag, largura_alvo, limite_tempo=None,
+                           nivel_confianca=0.95, min_execucoes=3, max_execucoes=100, preprocessar=False,
+                           semear=False, semente=None):
+    """
+    Executa o AG repetidamente até que a média do valor do frete esteja estimada com a precisão desejada.
+
+    Após cada execução, calcula o intervalo de confiança (t de Student) da média do valor total.
+    As execuções param quando a largura do intervalo fica abaixo de largura_alvo (após ao menos
+    min_execucoes), quando o tempo total passa de limite_tempo ou após max_execucoes. Instâncias
+    estáveis param após poucas execuções e instâncias ruidosas recebem mais execuções.
+
+    A função é um gerador: o resultado de cada execução é entregue assim que ela termina.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        max_peso: Peso máximo que o navio pode carregar.
+        max_volume: Volume máximo que o navio pode carregar.
+        params_ag: Um dicionário contendo os parâmetros para o algoritmo genético.
+        largura_alvo: Largura total máxima do intervalo de confiança da média do valor do frete.
+        limite_tempo: Tempo total máximo, em segundos, das execuções; None para não limitar.
+            Cada execução do AG recebe como limite o tempo que ainda resta.
+        nivel_confianca: Nível de confiança do intervalo.
+        min_execucoes: Número mínimo de execuções antes de avaliar a largura do intervalo.
+        max_execucoes: Número máximo de execuções.
+        preprocessar: Se True, reduz a instância com reduzir_instancia antes do AG.
+        semear: Se True, a solução da Gulosa Surrogada entra na população inicial do AG.
+        semente: Semente aleatória da primeira execução; a execução k usa semente + k.
+
+    Yields:
+        Um dicionário por execução com as chaves:
+            - 'execucao': Número da execução (a partir de 1).
+            - 'conteineres', 'peso_total', 'volume_total', 'valor_total': Solução da execução,
+              no formato de decodificar_solucao.
+            - 'tempo_execucao': Tempo da execução em segundos.
+            - 'geracoes': Número de gerações avaliadas pelo AG.
+            - 'referencia': True se, com preprocessar, a solução é a de referência da redução.
+            - 'media': Média do valor total até esta execução.
+            - 'largura_intervalo': Largura do intervalo de confiança da média (infinita com uma execução).
+            - 'concluido': True na última execução, quando um critério de parada foi atingido.
+    """
+    inicio = time.perf_counter()
+    reducao = reduzir_instancia(dados_conteineres, max_peso, max_volume) if preprocessar else None
+    if semear and reducao is None:
+        params_ag = dict(params_ag, sementes=[genoma_guloso(dados_conteineres, max_peso, max_volume)])
+
+    valores = []
+    for execucao in range(1, max_execucoes + 1):
+        if semente is not None:
+            random.seed(semente + execucao - 1)
+        parametros = params_ag
+        if limite_tempo is not None:
+            # A execução recebe apenas o que resta do tempo total, para não ultrapassá-lo
+            restante = max(limite_tempo - (time.perf_counter() - inicio), 0)
+            if params_ag.get("limite_tempo") is not None:
+                restante = min(restante, params_ag["limite_tempo"])
+            parametros = dict(params_ag, limite_tempo=restante)
+        inicio_execucao = time.perf_counter()
+        if reducao is not None:
+            melhor_solucao = algoritmo_genetico_preprocessado(dados_conteineres, reducao, False, semear, **parametros)
+        else:
+            melhor_solucao = algoritmo_genetico(dados_conteineres, max_peso, max_volume, False, **parametros)
+        tempo_execucao = time.perf_counter() - inicio_execucao
+        conteineres, peso_total, volume_total, valor_total = decodificar_solucao(melhor_solucao, dados_conteineres)
+        valores.append(valor_total)
+
+        media = sum(valores) / len(valores)
+        largura = float('inf')
+        if len(valores) > 1:
+            desvio = math.sqrt(sum((valor - media) ** 2 for valor in valores) / (len(valores) - 1))
+            largura = 2 * _quantil_t((1 + nivel_confianca) / 2, len(valores) - 1) * desvio / math.sqrt(len(valores))
+
+        concluido = ((execucao >= min_execucoes and largura <= largura_alvo)
+                     or (limite_tempo is not None and time.perf_counter() - inicio >= limite_tempo)
+                     or execucao == max_execucoes)
+        yield {
+            "execucao": execucao,
+            "conteineres": conteineres,
+            "peso_total": peso_total,
+            "volume_total": volume_total,
+            "valor_total": valor_total,
+            "tempo_execucao": tempo_execucao,
+            "geracoes": melhor_solucao.geracoes,
+            "referencia": reducao is not None and melhor_solucao.referencia,
+            "media": media,
+            "largura_intervalo": largura,
+            "concluido": concluido
+        }
+        if concluido:
+            return
+
+def executar_comparacao(dados_conteineres, max_peso, max_volume, params_ag, preprocessar=False, semear=False,
+                        semente=None, pasta_cache=None):
     """
     Executa e compara diferentes algoritmos para o problema de carregamento de contêineres.
 
     Esta função executa os seguintes algoritmos:
         - Algoritmo de Aproximação por Razão (AAR)
         - Heurística Gulosa
+        - Heurística Gulosa com multiplicadores surrogados
         - Busca Local
         - Algoritmo Genético (AG)
 
@@ -103,6 +353,13 @@ def executar_comparacao(dados_conteineres, max_peso, max_volume, params_ag):
         max_peso: Peso máximo que o navio pode carregar.
         max_volume: Volume máximo que o navio pode carregar.
         params_ag: Um dicionário contendo os parâmetros para o algoritmo genético.
+        preprocessar: Se True, reduz a instância com reduzir_instancia antes da Busca Local
+            e do AG, que passam a buscar apenas sobre o núcleo de contêineres incertos.
+        semear: Se True, a solução da Gulosa Surrogada entra na população inicial do AG.
+        semente: Semente aleatória aplicada antes de cada algoritmo, tornando as execuções reprodutíveis.
+        pasta_cache: Pasta do cache de resultados. Cada algoritmo só é executado se não houver
+            resultado armazenado para a mesma instância, parâmetros e semente. None desativa o cache.
+            Sem semente o cache nunca é lido nem gravado, pois as execuções são aleatórias.
 
     Returns:
         Um dicionário contendo os resultados de cada algoritmo, onde a chave é o nome
@@ -112,35 +369,139 @@ def executar_comparacao(dados_conteineres, max_peso, max_volume, params_ag):
             - 'volume_total': Volume total dos contêineres selecionados.
             - 'valor_total': Valor total dos contêineres selecionados.
             - 'tempo_execucao': Tempo de execução do algoritmo em segundos.
+            - 'referencia': True se, com preprocessar, a Busca Local ou o AG não superaram a
+              solução de referência da redução (a Gulosa Surrogada) e a devolveram no lugar
+              da sua própria.
     """
+    reducoes = []
+
+    def obter_reducao():
+        # A redução é calculada uma única vez e apenas se algum algoritmo precisar dela
+        if not reducoes:
+            reducoes.append(reduzir_instancia(dados_conteineres, max_peso, max_volume))
+        return reducoes[0]
+
+    def executar(algoritmo, parametros, funcao):
+        def medir():
+            if semente is not None:
+                random.seed(semente)
+            inicio = time.perf_counter()
+            resultado = funcao()
+            return {
+                "conteineres": resultado[0],
+                "peso_total": resultado[1],
+                "volume_total": resultado[2],
+                "valor_total": resultado[3],
+                "tempo_execucao": time.perf_counter() - inicio,
+                "referencia": len(resultado) > 4 and resultado[4]
+            }
+        chave = chave_cache(dados_conteineres, (max_peso, max_volume), algoritmo, parametros, semente)
+        # Sem semente as execuções são aleatórias e não podem ser reaproveitadas
+        return executar_com_cache(pasta_cache if semente is not None else None, chave, medir)
+
+    def executar_busca_local():
+        if preprocessar:
+            return busca_local_preprocessada(dados_conteineres, obter_reducao())
+        return busca_local(dados_conteineres, max_peso, max_volume)
+
+    def executar_ag():
+        if preprocessar:
+            melhor_solucao_ag = algoritmo_genetico_preprocessado(dados_conteineres, obter_reducao(), True, semear,
+                                                                 **params_ag)
+            return decodificar_solucao(melhor_solucao_ag, dados_conteineres) + (melhor_solucao_ag.referencia,)
+        parametros = params_ag
+        if semear:
+            parametros = dict(params_ag, sementes=[genoma_guloso(dados_conteineres, max_peso, max_volume)])
+        melhor_solucao_ag = algoritmo_genetico(dados_conteineres, max_peso, max_volume, True, **parametros)
+        return decodificar_solucao(melhor_solucao_ag, dados_conteineres)
+
     resultados = {}
 
     # Heurística Gulosa
-    resultado_gulosa = heuristica_gulosa(dados_conteineres, max_peso, max_volume)
-    resultados["Gulosa"] = {
-        "conteineres": resultado_gulosa[0],
-        "peso_total": resultado_gulosa[1],
-        "volume_total": resultado_gulosa[2],
-        "valor_total": resultado_gulosa[3]
-    }
+    resultados["Gulosa"] = executar("Gulosa", {}, lambda: heuristica_gulosa(dados_conteineres, max_peso, max_volume))
+
+    # Heurística Gulosa Surrogada
+    resultados["Gulosa Surrogada"] = executar(
+        "Gulosa Surrogada", {}, lambda: heuristica_gulosa_surrogada(dados_conteineres, max_peso, max_volume))
 
     # Busca Local
-    resultado_bl = busca_local(dados_conteineres, max_peso, max_volume)
-    resultados["Busca Local"] = {
-        "conteineres": resultado_bl[0],
-        "peso_total": resultado_bl[1],
-        "volume_total": resultado_bl[2],
-        "valor_total": resultado_bl[3]
-    }
+    resultados["Busca Local"] = executar("Busca Local", {"preprocessar": preprocessar}, executar_busca_local)
+
+    # Algoritmo Genético
+    resultados["AG"] = executar("AG", dict(params_ag, preprocessar=preprocessar, semear=semear), executar_ag)
+
+    return resultados
+
+def executar_comparacao_multinavio(dados_conteineres, capacidades, params_ag, semear=False, semente=None):
+    """
+    Executa e compara a Heurística Gulosa e o AG no carregamento de vários navios.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        capacidades: Lista de tuplas (max_peso, max_volume), uma por navio.
+        params_ag: Um dicionário contendo os parâmetros para o algoritmo genético.
+        semear: Se True, a solução da Gulosa multinavio entra na população inicial do AG.
+        semente: Semente aleatória aplicada antes do AG, tornando a execução reprodutível.
 
+    Returns:
+        Um dicionário contendo os resultados de cada algoritmo, com as mesmas chaves de
+        executar_comparacao e a chave adicional 'navios', com o resultado de cada navio
+        no formato de decodificar_solucao_multinavio.
+    """
+    resultados = {}
+
+    # Heurística Gulosa
+    atribuicao_gulosa = heuristica_gulosa_multinavio(dados_conteineres, capacidades)[0]
     # Algoritmo Genético
-    melhor_solucao_ag = algoritmo_genetico(dados_conteineres, max_peso, max_volume, True, **params_ag)
-    resultado_ag = decodificar_solucao(melhor_solucao_ag, dados_conteineres)
-    resultados["AG"] = {
-        "conteineres": resultado_ag[0],
-        "peso_total": resultado_ag[1],
-        "volume_total": resultado_ag[2],
-        "valor_total": resultado_ag[3]
-    }
+    if semear:
+        params_ag = dict(params_ag, sementes=[atribuicao_gulosa])
+    if semente is not None:
+        random.seed(semente)
+    melhor_solucao_ag = algoritmo_genetico_multinavio(dados_conteineres, capacidades, **params_ag)
+
+    for nome, genoma in (("Gulosa", atribuicao_gulosa), ("AG", melhor_solucao_ag.genoma)):
+        individuo = Individuo(genoma)
+        resultado = decodificar_solucao(individuo, dados_conteineres)
+        resultados[nome] = {
+            "conteineres": resultado[0],
+            "peso_total": resultado[1],
+            "volume_total": resultado[2],
+            "valor_total": resultado[3],
+            "navios": decodificar_solucao_multinavio(individuo, dados_conteineres, len(capacidades))
+        }
 
     return resultados
+
+def executar_pareto(dados_conteineres, max_peso, max_volume, params_pareto, semente=None):
+    """
+    Executa o AG multiobjetivo e decodifica cada solução da frente de Pareto.
+
+    Args:
+        dados_conteineres: Lista de tuplas contendo os dados dos contêineres (peso, volume, valor).
+        max_peso: Peso máximo que o navio pode carregar.
+        max_volume: Volume máximo que o navio pode carregar.
+        params_pareto: Dicionário com tamanho_populacao, num_geracoes, taxa_crossover e taxa_mutacao.
+        semente: Semente aleatória aplicada antes do AG, tornando a execução reprodutível.
+
+    Returns:
+        Uma lista de dicionários, um por solução da frente (em ordem decrescente de valor), com
+        as mesmas chaves de executar_comparacao e as chaves adicionais:
+            - 'utilizacao': Utilização média da capacidade (0 a 1).
+            - 'desequilibrio': Diferença absoluta entre as utilizações de peso e volume.
+    """
+    if semente is not None:
+        random.seed(semente)
+    frente = algoritmo_genetico_pareto(dados_conteineres, max_peso, max_volume, **params_pareto)
+    resultados = []
+    for individuo in frente:
+        resultado = decodificar_solucao(individuo, dados_conteineres)
+        _, utilizacao, equilibrio = individuo.objetivos
+        resultados.append({
+            "conteineres": resultado[0],
+            "peso_total": resultado[1],
+            "volume_total": resultado[2],
+            "valor_total": resultado[3],
+            "utilizacao": utilizacao,
+            "desequilibrio": -equilibrio
+        })
+    return resultados
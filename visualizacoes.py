@@ -75,6 +75,30 @@ def plot_improvements(melhorias, labels=['Valor do Frete', 'Número de Contêine
     ax.grid(axis='y', linestyle='--', alpha=0.7)
 
     # Salva o gráfico em um arquivo, se o nome do arquivo for fornecido
+    if filename:
+        plt.savefig(filename, dpi=300, bbox_inches='tight')
+    plt.show()
+
+def plot_pareto(valores, utilizacoes, equilibrios, title='Frente de Pareto', filename=None):
+    """
+    Plota a frente de Pareto do AG multiobjetivo como um gráfico de dispersão.
+
+    Args:
+        valores (list): Valor total do frete de cada solução da frente.
+        utilizacoes (list): Utilização média da capacidade (0 a 1) de cada solução.
+        equilibrios (list): Diferença absoluta entre as utilizações de peso e volume de cada solução,
+                            usada para colorir os pontos.
+        title (str, optional): O título do gráfico. Defaults to 'Frente de Pareto'.
+        filename (str, optional): O nome do arquivo para salvar o gráfico. Defaults to None.
+    """
+    fig, ax = plt.subplots()
+    pontos = ax.scatter([u * 100 for u in utilizacoes], valores, c=equilibrios, cmap='viridis_r')
+    fig.colorbar(pontos, ax=ax, label='Desequilíbrio Peso x Volume')
+    ax.set_title(title)
+    ax.set_xlabel('Utilização Média da Capacidade (%)')
+    ax.set_ylabel('Valor do Frete ($)')
+    ax.grid(linestyle='--', alpha=0.7)
+
     if filename:
         plt.savefig(filename, dpi=300, bbox_inches='tight')
     plt.show()
\ No newline at end of file